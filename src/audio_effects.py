@@ -6,9 +6,7 @@ import tempfile
 import wave
 from typing import Dict, List, Optional
 
-import numpy as np
 import pygame
-from scipy.signal import butter, filtfilt
 
 
 class Equalizer:
@@ -10,12 +10,63 @@ import pygame
 class FontManager:
     """Manages font initialization with fallback backends for robustness"""
 
-    def __init__(self, bundled_font_path: Optional[str] = None):
+    # Seven-segment style font used for the 4-digit selection display
+    DIGITS_FONT_PATH = os.path.normpath(
+        os.path.join(os.path.dirname(__file__), "..", "assets", "fonts", "DS-DIGIT.TTF")
+    )
+
+    def __init__(
+        self,
+        bundled_font_path: Optional[str] = None,
+        digits_font_path: Optional[str] = DIGITS_FONT_PATH,
+    ):
         self.bundled_font_path = bundled_font_path
+        self.digits_font_path = digits_font_path
         self.font_file_used: Optional[str] = None
 
-    def init_fonts(self) -> Dict[str, object]:
+    def init_fonts(self, digits_font_size: int = 72) -> Dict[str, object]:
         """Initialize and return all UI fonts with appropriate fallbacks"""
+        fonts = self._init_base_fonts()
+        self._init_extra_fonts(fonts, digits_font_size)
+        return fonts
+
+    def _init_extra_fonts(
+        self, fonts: Dict[str, object], digits_font_size: int
+    ) -> None:
+        """Add the credits and selection-digits fonts, derived from the base set"""
+        # A slightly larger credits font (small_font size + 5px) so the
+        # credits counter stands out
+        try:
+            desired_h = max(8, int(fonts["small_font"].get_height()) + 5)
+            try:
+                fonts["credits_font"] = pygame.font.SysFont(None, desired_h)
+            except Exception:
+                # If SysFont isn't available, use medium_font as a fallback
+                fonts["credits_font"] = fonts["medium_font"]
+        except Exception:
+            fonts["credits_font"] = fonts["small_font"]
+
+        # DS-DIGIT.TTF for the selection display when present, otherwise a
+        # large system font
+        try:
+            if self.digits_font_path and os.path.exists(self.digits_font_path):
+                try:
+                    fonts["selection_digits_font"] = pygame.font.Font(
+                        self.digits_font_path, digits_font_size
+                    )
+                except Exception:
+                    fonts["selection_digits_font"] = pygame.font.SysFont(
+                        None, digits_font_size
+                    )
+            else:
+                fonts["selection_digits_font"] = pygame.font.SysFont(
+                    None, digits_font_size
+                )
+        except Exception:
+            fonts["selection_digits_font"] = fonts["large_font"]
+
+    def _init_base_fonts(self) -> Dict[str, object]:
+        """Build the core text fonts from the first backend that works"""
         fonts = {}
 
         try:
@@ -7,6 +7,7 @@ support is missing or the file cannot be opened by pygame for any reason.
 Functions are designed to never crash on import and return None on failure.
 """
 import os
+import threading
 from typing import Optional, Tuple
 
 
@@ -25,8 +26,17 @@ def _pil_image_to_pygame_surface(pil_image) -> "pygame.Surface":
     size = pil_image.size
     raw = pil_image.tobytes()
 
-    surface = pygame.image.fromstring(raw, size, mode)
-    # Convert to a display-friendly format if possible
+    # frombuffer wraps the bytes without copying them again (the surface
+    # keeps a reference to the buffer); converting below makes the copy
+    surface = pygame.image.frombuffer(raw, size, mode)
+    # Convert to a display-friendly format if possible. Display access is
+    # not thread-safe, so surfaces loaded on worker threads are returned
+    # as-is and converted by the caller on the main thread.
+    if (
+        threading.current_thread() is not threading.main_thread()
+        or pygame.display.get_surface() is None
+    ):
+        return surface
     try:
         surface = (
             surface.convert_alpha() if mode in ("RGBA", "LA") else surface.convert()
@@ -54,7 +64,12 @@ def load_image_surface(
     try:
         import pygame
 
-        surf = pygame.image.load(path)
+        # Call SDL_image directly when pygame was built with it, skipping
+        # load()'s dispatch between the basic and extended loaders
+        if pygame.image.get_extended() and hasattr(pygame.image, "load_extended"):
+            surf = pygame.image.load_extended(path)
+        else:
+            surf = pygame.image.load(path)
         if size and hasattr(surf, "get_size"):
             try:
                 surf = pygame.transform.smoothscale(surf, size)
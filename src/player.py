@@ -1,18 +1,47 @@
 """
 Music Player Module - Handles all music playback functionality
 """
+import logging
 import os
 from typing import List, Optional
 
-import pygame
-
 from src.album_library import AlbumLibrary
-from src.audio_utils import is_mixer_available
+
+_log = logging.getLogger(__name__)
+
+# pygame is imported on first use so that importing this module (e.g. for
+# queue/library logic) does not pay the SDL extension load cost.
+_pygame = None
+
+
+def _pg():
+    """Return the pygame module, importing it on first call"""
+    global _pygame
+    if _pygame is None:
+        import pygame as _p
+
+        _pygame = _p
+    return _pygame
 
 
 class MusicPlayer:
     """Manages music playback and playlist operations"""
 
+    __slots__ = (
+        "library",
+        "equalizer",
+        "current_album_id",
+        "current_track_index",
+        "is_playing",
+        "is_paused",
+        "volume",
+        "queue",
+        "_track_info_cache_key",
+        "_track_info_cache",
+        "_mixer_ok",
+        "_credits",
+    )
+
     def __init__(self, library: AlbumLibrary, equalizer=None):
         """
         Initialize the music player
@@ -29,9 +58,18 @@ class MusicPlayer:
         self.is_paused = False
         self.volume = 0.7
 
-        # Queue system: list of (album_id, track_index) tuples
+        # Queue system: list of packed (album_id << 32) | track_index ints.
+        # Use _decode() to unpack an entry; get_queue() returns tuples.
         self.queue = []
-        self.queue_index = 0
+
+        # Cached result of get_current_track_info(), keyed by
+        # (current_album_id, current_track_index). The UI polls it per frame.
+        self._track_info_cache_key = None
+        self._track_info_cache = None
+
+        # True once the mixer is known to be initialised; mixer calls are
+        # skipped while it is False instead of raising pygame.error.
+        self._mixer_ok = False
 
         # Set initial volume if an audio mixer is available — otherwise warn.
         try:
@@ -41,7 +79,8 @@ class MusicPlayer:
 
         if is_mixer_available is not None and is_mixer_available():
             try:
-                pygame.mixer.music.set_volume(self.volume)
+                _pg().mixer.music.set_volume(self.volume)
+                self._mixer_ok = True
             except Exception:
                 # If calling mixer functions fails for any reason, continue
                 # but provide a helpful message later when playback is attempted.
@@ -55,18 +94,19 @@ class MusicPlayer:
 
                 ok, msg = attempt_mixer_init()
                 if ok:
+                    self._mixer_ok = True
                     try:
-                        pygame.mixer.music.set_volume(self.volume)
+                        _pg().mixer.music.set_volume(self.volume)
                     except Exception:
                         pass
                 else:
-                    print(
-                        "Warning: audio mixer not available — playback disabled until mixer is provided.",
+                    _log.warning(
+                        "Audio mixer not available — playback disabled until mixer is provided. %s",
                         msg,
                     )
             except Exception:
-                print(
-                    "Warning: audio mixer not available — playback disabled until mixer is provided."
+                _log.warning(
+                    "Audio mixer not available — playback disabled until mixer is provided."
                 )
 
         # Start with first available album
@@ -107,6 +147,16 @@ class MusicPlayer:
         """Return the current number of available credits."""
         return self._credits
 
+    @staticmethod
+    def _encode(album_id: int, track_index: int) -> int:
+        """Pack an (album_id, track_index) pair into a single queue entry"""
+        return (album_id << 32) | (track_index & 0xFFFFFFFF)
+
+    @staticmethod
+    def _decode(entry: int) -> tuple:
+        """Unpack a queue entry into an (album_id, track_index) tuple"""
+        return entry >> 32, entry & 0xFFFFFFFF
+
     def get_current_album(self):
         """Get the current album"""
         if self.current_album_id is None:
@@ -139,10 +189,10 @@ class MusicPlayer:
         # an extra credit to append to the queue.
         if was_empty and not (self.is_music_playing() or self.is_playing):
             if not self.use_credit():
-                print("Insufficient credits to start playback")
+                _log.info("Insufficient credits to start playback")
                 return
-        self.queue.append((album_id, track_index))
-        print(f"Added to queue: Album {album_id:02d}, Track {track_index + 1:02d}")
+        self.queue.append(self._encode(album_id, track_index))
+        _log.debug("Added to queue: Album %02d, Track %02d", album_id, track_index + 1)
 
         # If queue was empty and nothing is playing, start playing
         if was_empty and not self.is_music_playing():
@@ -151,28 +201,35 @@ class MusicPlayer:
             self.start_queue(require_credit=False)
 
     def get_queue(self) -> List[tuple]:
-        """Get the current queue"""
-        return self.queue
+        """Get the current queue as a list of (album_id, track_index) tuples"""
+        return [self._decode(entry) for entry in self.queue]
 
     def clear_queue(self) -> None:
         """Clear the entire queue"""
-        self.queue = []
-        self.queue_index = 0
-        print("Queue cleared")
+        # Empty in place rather than rebinding to keep the same list object
+        del self.queue[:]
+        _log.info("Queue cleared")
 
     def get_queue_info(self) -> str:
         """Get formatted queue information"""
         if not self.queue:
             return "Queue is empty"
 
-        queue_text = f"Queue ({len(self.queue)} songs):\n"
-        for i, (album_id, track_index) in enumerate(self.queue):
-            album = self.library.get_album(album_id)
+        # Bind attribute lookups to locals once; long queues iterate many times
+        queue = self.queue
+        get_album = self.library.get_album
+        decode = self._decode
+        playing = self.is_playing
+
+        lines = [f"Queue ({len(queue)} songs):"]
+        for i, entry in enumerate(queue):
+            album_id, track_index = decode(entry)
+            album = get_album(album_id)
             if album and 0 <= track_index < len(album.tracks):
                 track = album.tracks[track_index]
-                status = " [PLAYING]" if i == 0 and self.is_playing else ""
-                queue_text += f"{i+1:2d}. {album.artist} - {track['title']}{status}\n"
-        return queue_text.strip()
+                status = " [PLAYING]" if i == 0 and playing else ""
+                lines.append(f"{i+1:2d}. {album.artist} - {track['title']}{status}")
+        return "\n".join(lines).strip()
 
     def play_from_queue(self, require_credit: bool = True) -> None:
         """Play the current track from the queue (always at index 0)
@@ -183,15 +240,14 @@ class MusicPlayer:
                 queue progression).
         """
         if not self.queue:
-            print("Queue is empty")
+            _log.info("Queue is empty")
             return
 
-        self.queue_index = 0
-        album_id, track_index = self.queue[0]
+        album_id, track_index = self._decode(self.queue[0])
         # If this playback is user-initiated and credits are required, try to use one
         if require_credit:
             if not self.use_credit():
-                print("Insufficient credits to play from queue")
+                _log.info("Insufficient credits to play from queue")
                 return
         self._play_track(album_id, track_index)
 
@@ -199,14 +255,15 @@ class MusicPlayer:
         """Internal method to play a specific track"""
         self.current_album_id = album_id
         self.current_track_index = track_index
+        self._track_info_cache_key = None
 
         album = self.get_current_album()
         if not album or not album.tracks:
-            print("No album or tracks available")
+            _log.warning("No album or tracks available")
             return
 
         if not (0 <= self.current_track_index < len(album.tracks)):
-            print("Invalid track index")
+            _log.warning("Invalid track index")
             return
 
         try:
@@ -218,7 +275,7 @@ class MusicPlayer:
                 processed_file = self.equalizer.process_file(file_path)
                 if processed_file and processed_file != file_path:
                     file_path = processed_file
-                    print(f"Applied equalizer processing")
+                    _log.debug("Applied equalizer processing")
 
             # Ensure the mixer is available before attempting to play audio
             try:
@@ -244,14 +301,16 @@ class MusicPlayer:
                         "Audio mixer is not available. Ensure pygame was installed with SDL_mixer/system audio libs and reinstall pygame."
                     )
 
-            pygame.mixer.music.load(file_path)
-            pygame.mixer.music.play()
+            music = _pg().mixer.music
+            music.load(file_path)
+            music.play()
+            self._mixer_ok = True
             self.is_playing = True
             self.is_paused = False
-            print(f"Now playing: {album.artist} - {album.title}")
-            print(f"Track: {track['title']} ({track['duration_formatted']})")
+            _log.info("Now playing: %s - %s", album.artist, album.title)
+            _log.info("Track: %s (%s)", track["title"], track["duration_formatted"])
         except Exception as e:
-            print(f"Error playing track: {e}")
+            _log.error("Error playing track: %s", e)
 
     def play(
         self, album_id: Optional[int] = None, track_index: Optional[int] = None
@@ -270,47 +329,40 @@ class MusicPlayer:
             # If nothing is playing and we have a queue, play from queue
             self.play_from_queue(require_credit=False)
         else:
-            print("No track specified or already playing")
+            _log.info("No track specified or already playing")
 
     def next_track(self) -> None:
         """Play the next track in the queue"""
         if not self.queue:
-            print("Queue is empty")
+            _log.info("Queue is empty")
             return
 
         # Remove the currently playing song from the queue
         if len(self.queue) > 0:
-            completed_song = self.queue.pop(0)
-            print(f"Completed: {completed_song}")
+            completed_song = self._decode(self.queue.pop(0))
+            _log.debug("Completed: %s", completed_song)
 
         # Play the next song (now at index 0) if queue not empty
         if self.queue:
-            self.queue_index = 0
             self.play_from_queue()
         else:
-            print("Queue completed")
+            _log.info("Queue completed")
             self.is_playing = False
             # Stop only if mixer is available
-            try:
-                from src.audio_utils import is_mixer_available
-            except Exception:
-                is_mixer_available = None
-
-            if is_mixer_available is not None and is_mixer_available():
+            if self._mixer_ok:
                 try:
-                    pygame.mixer.music.stop()
+                    _pg().mixer.music.stop()
                 except Exception:
                     pass
 
     def previous_track(self) -> None:
         """Play the previous track (restart current track since previous songs are removed)"""
         if not self.queue:
-            print("Queue is empty")
+            _log.info("Queue is empty")
             return
 
         # Since previous songs are removed, just restart the current track
-        print("Restarting current track")
-        self.queue_index = 0
+        _log.info("Restarting current track")
         self.play_from_queue(require_credit=False)
 
     def update_music_state(self) -> None:
@@ -323,11 +375,11 @@ class MusicPlayer:
         if not self.is_playing:
             return
 
-        if not is_mixer_available():
+        if not self._mixer_ok:
             return
 
         try:
-            if not pygame.mixer.music.get_busy():
+            if not _pg().mixer.music.get_busy():
                 # Track ended, move to next in queue
                 self.next_track()
         except Exception:
@@ -337,23 +389,22 @@ class MusicPlayer:
     def start_queue(self, require_credit: bool = True) -> None:
         """Start playing from the beginning of the queue"""
         if self.queue:
-            self.queue_index = 0
             self.play_from_queue(require_credit=require_credit)
         else:
-            print("Queue is empty")
+            _log.info("Queue is empty")
 
     def pause(self) -> None:
         """Pause the current track (safe when mixer unavailable)."""
         if not self.is_playing or self.is_paused:
             return
 
-        if not is_mixer_available():
+        if not self._mixer_ok:
             # Mixer not available — change logical state only
             self.is_paused = True
             return
 
         try:
-            pygame.mixer.music.pause()
+            _pg().mixer.music.pause()
         except Exception:
             # If pause fails, keep internal state consistent
             pass
@@ -364,13 +415,13 @@ class MusicPlayer:
         if not self.is_paused:
             return
 
-        if not is_mixer_available():
+        if not self._mixer_ok:
             # Mixer not available — only update logical state
             self.is_paused = False
             return
 
         try:
-            pygame.mixer.music.unpause()
+            _pg().mixer.music.unpause()
         except Exception:
             # Ignore errors coming from mixer
             pass
@@ -378,9 +429,9 @@ class MusicPlayer:
 
     def stop(self) -> None:
         """Stop the current track (no-op if mixer unavailable)."""
-        if is_mixer_available():
+        if self._mixer_ok:
             try:
-                pygame.mixer.music.stop()
+                _pg().mixer.music.stop()
             except Exception:
                 pass
         self.is_playing = False
@@ -443,9 +494,9 @@ class MusicPlayer:
             final_volume = self.equalizer.apply_to_volume(self.volume)
 
         # Set mixer volume only if mixer is available; ignore errors
-        if is_mixer_available():
+        if self._mixer_ok:
             try:
-                pygame.mixer.music.set_volume(final_volume)
+                _pg().mixer.music.set_volume(final_volume)
             except Exception:
                 pass
 
@@ -454,16 +505,37 @@ class MusicPlayer:
         return self.volume
 
     def get_current_track_info(self) -> Optional[dict]:
-        """Get current track information for optimization comparison"""
+        """Get current track information for optimization comparison
+
+        The result only depends on the current album/track and the library
+        data, so it is cached and recomputed when either changes (or a new
+        track is played). The library and its albums dict are compared by
+        identity, which covers both a replaced library and an in-place rescan.
+        """
+        library = self.library
+        albums = getattr(library, "albums", None)
+        key = (library, albums, self.current_album_id, self.current_track_index)
+        cached = self._track_info_cache_key
+        if (
+            cached is not None
+            and cached[0] is library
+            and cached[1] is albums
+            and cached[2:] == key[2:]
+        ):
+            return self._track_info_cache
+
+        info = None
         track = self.get_current_track()
         if track:
-            return {
+            info = {
                 "album_id": self.current_album_id,
                 "track_index": self.current_track_index,
                 "title": track.get("title", ""),
                 "artist": track.get("artist", ""),
             }
-        return None
+        self._track_info_cache_key = key
+        self._track_info_cache = info
+        return info
 
     def is_music_playing(self) -> bool:
         """Check if music is currently playing.
@@ -473,9 +545,9 @@ class MusicPlayer:
         pygame was built without audio support.
         """
         try:
-            if not is_mixer_available():
+            if not self._mixer_ok:
                 return False
-            return bool(pygame.mixer.music.get_busy())
+            return bool(_pg().mixer.music.get_busy())
         except Exception:
             return False
 
@@ -494,8 +566,9 @@ class MusicPlayer:
         if self.equalizer and hasattr(self.equalizer, "cleanup"):
             self.equalizer.cleanup()
 
-        if is_mixer_available():
+        if self._mixer_ok:
             try:
-                pygame.mixer.music.stop()
+                _pg().mixer.music.stop()
             except Exception:
                 pass
+            self._mixer_ok = False
@@ -1,26 +1,278 @@
 """
 Theme Manager Module - Handles application theming with images
 """
+import configparser
+import functools
+import hashlib
+import importlib.util
 import io
 import os
+import re
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, Optional, Tuple
 
 import pygame
 
 try:
-    from reportlab.graphics import renderPM
-    from svglib.svglib import svg2rlg
+    from src.image_utils import load_image_surface
+except Exception:
+    load_image_surface = None
 
-    SVG_SUPPORT = True
+# Preferred SVG renderer: cairosvg rasterizes in C straight to PNG bytes.
+# Importing it raises OSError when the cairo shared library is missing.
+try:
+    import cairosvg
+
+    CAIROSVG_SUPPORT = True
+except (ImportError, OSError):
+    CAIROSVG_SUPPORT = False
+
+# Fallback SVG renderer: svglib parses in Python and reportlab rasterizes.
+# Both pull in a large number of submodules, so they are only imported up
+# front when no faster renderer exists; otherwise on first fallback use.
+svg2rlg = None
+renderPM = None
+SVGLIB_SUPPORT = False
+_SVGLIB_ERROR = None
+
+
+def _import_svglib() -> bool:
+    """Import svglib/reportlab on demand, returning whether they are usable"""
+    global svg2rlg, renderPM, SVGLIB_SUPPORT, _SVGLIB_ERROR
+    if svg2rlg is not None:
+        return True
+    try:
+        from reportlab.graphics import renderPM as _renderPM
+        from svglib.svglib import svg2rlg as _svg2rlg
+    except ImportError as e:
+        SVGLIB_SUPPORT = False
+        _SVGLIB_ERROR = f"SVG support not available. Error: {e}"
+        return False
+    except OSError as e:
+        SVGLIB_SUPPORT = False
+        _SVGLIB_ERROR = f"SVG support disabled due to library issue: {e}"
+        return False
+    renderPM = _renderPM
+    svg2rlg = _svg2rlg
+    SVGLIB_SUPPORT = True
+    return True
+
+
+def _probe_pygame_svg() -> bool:
+    """Return True if pygame's SDL_image build can load SVG (nanosvg)"""
+    try:
+        if not pygame.image.get_extended():
+            return False
+        probe = b'<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"/>'
+        pygame.image.load(io.BytesIO(probe), "probe.svg")
+        return True
+    except Exception:
+        return False
+
+
+# Second choice: SDL_image parses and rasterizes SVG in C, skipping the
+# pure-Python svglib parser entirely.
+PYGAME_SVG_SUPPORT = _probe_pygame_svg()
+
+if CAIROSVG_SUPPORT or PYGAME_SVG_SUPPORT:
+    # Only needed as a fallback: check the packages exist without importing
+    SVGLIB_SUPPORT = all(
+        importlib.util.find_spec(mod) is not None for mod in ("svglib", "reportlab")
+    )
+else:
+    _import_svglib()
+
+SVG_SUPPORT = CAIROSVG_SUPPORT or PYGAME_SVG_SUPPORT or SVGLIB_SUPPORT
+if CAIROSVG_SUPPORT:
+    print("SVG support enabled with cairosvg")
+elif PYGAME_SVG_SUPPORT:
+    print("SVG support enabled with SDL_image")
+elif SVGLIB_SUPPORT:
     print("SVG support enabled with svglib/reportlab")
-except ImportError as e:
-    SVG_SUPPORT = False
-    print(f"SVG support not available. Error: {e}")
-    print("Install with: pip install svglib reportlab")
-except OSError as e:
-    SVG_SUPPORT = False
-    print(f"SVG support disabled due to library issue: {e}")
-    print("To fix: pip install svglib reportlab")
+else:
+    print(_SVGLIB_ERROR)
+    print("Install with: pip install cairosvg (or: pip install svglib reportlab)")
+
+
+# Fallback color for lookups that have no theme value and no default
+_DEFAULT_GRAY = (128, 128, 128)
+
+# theme.conf color values: "#RRGGBB" or "r,g,b"
+_COLOR_RE = re.compile(r"^\s*(?:#([0-9a-fA-F]{6})|(\d+)\s*,\s*(\d+)\s*,\s*(\d+))\s*$")
+
+# Rasterized SVGs are persisted as PNGs so later launches decode a PNG
+# instead of re-rendering the SVG.
+_SVG_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "jukebox",
+    "svgcache",
+)
+# Most PNGs kept in the SVG raster cache; the oldest are removed beyond this
+_SVG_CACHE_MAX_FILES = 200
+
+
+def _prune_svg_cache() -> None:
+    """Delete the oldest SVG raster cache files beyond _SVG_CACHE_MAX_FILES"""
+    try:
+        entries = [
+            e
+            for e in os.scandir(_SVG_CACHE_DIR)
+            if e.is_file() and not e.name.endswith(".tmp")
+        ]
+    except OSError:
+        return
+    excess = len(entries) - _SVG_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime_ns)
+    for entry in entries[:excess]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _on_main_thread() -> bool:
+    """Return True on the main thread, the only one that touches the display"""
+    return threading.current_thread() is threading.main_thread()
+
+
+def _display_format(
+    surf: Optional[pygame.Surface], opaque: bool = False
+) -> Optional[pygame.Surface]:
+    """Return `surf` converted to the display pixel format when possible.
+
+    Blits between surfaces of the same format take SDL's fast path instead
+    of converting every pixel on every blit. Conversion needs an active
+    display, so before one exists the surface is returned unchanged. SDL
+    display access is not thread-safe, so on worker threads (preload, loader
+    pool) the surface is also returned unchanged and converted later on the
+    main thread. With `opaque`, images without per-pixel alpha are converted
+    without an alpha channel so their blits are plain copies rather than
+    blends.
+    """
+    if surf is None or not _on_main_thread() or pygame.display.get_surface() is None:
+        return surf
+    try:
+        if opaque and not surf.get_flags() & pygame.SRCALPHA:
+            return surf.convert()
+        return surf.convert_alpha()
+    except pygame.error:
+        return surf
+
+
+# Process-wide cache of decoded image surfaces keyed by
+# (real path, size, mtime_ns). Themes that share artwork (including through
+# symlinks), and repeated
+# theme discovery, reuse an already-decoded surface instead of decoding the
+# file again. Bounded LRU; entries for modified files simply age out since
+# their key no longer matches. Values are (surface, converted) so surfaces
+# decoded before the display existed are converted once on a later hit.
+_SURFACE_CACHE: "OrderedDict[tuple, Tuple[pygame.Surface, bool]]" = OrderedDict()
+_SURFACE_CACHE_MAX = 128
+# Guards _SURFACE_CACHE; themes may load assets from a preload thread
+_SURFACE_CACHE_LOCK = threading.Lock()
+
+
+def _cached_load(
+    path: str, size: Optional[Tuple[int, int]] = None, opaque: bool = False
+) -> Optional[pygame.Surface]:
+    """Load an image via the robust loader, reusing cached surfaces.
+
+    The returned surface is shared and must be treated as read-only.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    key = (os.path.realpath(path), size, mtime_ns, opaque)
+    has_display = _on_main_thread() and pygame.display.get_surface() is not None
+    with _SURFACE_CACHE_LOCK:
+        entry = _SURFACE_CACHE.get(key)
+        if entry is not None:
+            surf, converted = entry
+            if has_display and not converted:
+                surf = _display_format(surf, opaque)
+                _SURFACE_CACHE[key] = (surf, True)
+            _SURFACE_CACHE.move_to_end(key)
+            return surf
+
+    # Robust loader that falls back to Pillow if pygame can't load PNGs
+    if load_image_surface is not None:
+        surf = load_image_surface(path, size=size)
+    else:
+        surf = pygame.image.load(path)
+        if size:
+            surf = pygame.transform.smoothscale(surf, size)
+    if surf is not None:
+        surf = _display_format(surf, opaque)
+        with _SURFACE_CACHE_LOCK:
+            _SURFACE_CACHE[key] = (surf, has_display)
+            if len(_SURFACE_CACHE) > _SURFACE_CACHE_MAX:
+                _SURFACE_CACHE.popitem(last=False)
+    return surf
+
+
+# Parsed theme.conf files keyed by (path, mtime_ns, size): section name ->
+# {key: raw value}. Rebuilding a theme whose conf is unchanged (or a theme
+# sharing nothing but an unmodified conf) skips the INI parse entirely.
+_CONF_CACHE: Dict[tuple, Dict[str, Dict[str, str]]] = {}
+
+
+def _conf_signature(path: str) -> Optional[tuple]:
+    """Return the (path, mtime_ns, size) cache key for a conf file, or None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def _load_conf_cached(path: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Parse an INI file into {section: {key: value}}, reusing cached results.
+
+    The returned mapping is shared and must be treated as read-only.
+    """
+    key = _conf_signature(path)
+    if key is None:
+        return None
+    sections = _CONF_CACHE.get(key)
+    if sections is not None:
+        return sections
+
+    # No interpolation is used in theme.conf; skip its per-value cost
+    parser = configparser.RawConfigParser()
+    try:
+        parser.read(path)
+    except Exception:
+        return None
+    sections = {name: dict(parser.items(name)) for name in parser.sections()}
+    _CONF_CACHE[key] = sections
+    return sections
+
+
+# Marks a theme asset slot that has not been loaded yet
+_NOT_LOADED = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _placeholder_png(size: Tuple[int, int], color: Tuple[int, int, int]) -> bytes:
+    """Return PNG-encoded bytes of a solid-color placeholder image.
+
+    Encoded once per (size, color); later theme creations just write the
+    bytes instead of allocating, filling and PNG-encoding a surface again.
+    """
+    surf = pygame.Surface(size)
+    surf.fill(color)
+    buf = io.BytesIO()
+    pygame.image.save(surf, buf, "placeholder.png")
+    return buf.getvalue()
 
 
 class Theme:
@@ -28,20 +280,104 @@ class Theme:
 
     # Default colors used when a theme doesn't override values. Kept as a
     # class-level constant so other modules (eg. ThemeManager) can reference
-    # the canonical defaults without instantiating Theme objects.
-    DEFAULT_COLORS = {
-        "background": (32, 32, 32),
-        "text": (255, 255, 255),
-        "text_secondary": (200, 200, 200),
-        "accent": (100, 200, 100),
-        "button": (64, 64, 64),
-        "button_hover": (100, 100, 100),
-        "button_pressed": (50, 50, 50),
-        "button_text": (255, 255, 255),
-        "artist_text": (255, 255, 255),
-        "album_text": (200, 200, 200),
-        "track_list": (200, 200, 200),
-    }
+    # the canonical defaults without instantiating Theme objects. Read-only:
+    # themes without overrides share it rather than holding a copy.
+    DEFAULT_COLORS = MappingProxyType(
+        {
+            "background": (32, 32, 32),
+            "text": (255, 255, 255),
+            "text_secondary": (200, 200, 200),
+            "accent": (100, 200, 100),
+            "button": (64, 64, 64),
+            "button_hover": (100, 100, 100),
+            "button_pressed": (50, 50, 50),
+            "button_text": (255, 255, 255),
+            "artist_text": (255, 255, 255),
+            "album_text": (200, 200, 200),
+            "track_list": (200, 200, 200),
+        }
+    )
+
+    # Assets drawn as full opaque layers; converted without per-pixel alpha
+    # (unless the image has some) so blitting them is a straight copy
+    _OPAQUE_ASSETS = frozenset(("background",))
+
+    # Assets needed for the first frame, decoded ahead by preload_async()
+    _HOT_ASSETS = ("background", "play_button", "pause_button", "stop_button")
+
+    # Number of rasterized SVG background sizes kept per theme
+    _BG_CACHE_MAX = 4
+
+    # Resolution button-sized SVGs are rasterized at once with cairosvg; each
+    # square use size is then a smoothscale of that master rather than
+    # another SVG render (see _render_svg_at)
+    _SVG_MASTER_SIZE = (256, 256)
+
+    # Theme assets: (attribute, png file, svg file, size, svg_first).
+    # Buttons are loaded at the size the UI draws them at to avoid rescaling
+    # at render-time; for their normal state a themed SVG takes precedence
+    # over the PNG. Every other asset prefers the PNG.
+    _ASSET_SPEC = (
+        ("background", "background.png", "background.svg", None, False),
+        ("button", "button.png", None, None, False),
+        ("button_hover", "button_hover.png", None, None, False),
+        ("button_pressed", "button_pressed.png", None, None, False),
+        ("slider_track", "slider_track.png", "slider_track.svg", None, False),
+        (
+            "slider_track_vertical",
+            "slider_track_vertical.png",
+            "slider_track_vertical.svg",
+            None,
+            False,
+        ),
+        ("slider_knob", "slider_knob.png", None, None, False),
+    ) + tuple(
+        (
+            f"{button_type}_button{suffix}",
+            f"{button_type}_button{suffix}.png",
+            f"{button_type}_button{suffix}.svg",
+            size,
+            suffix == "",
+        )
+        for button_type, size in (
+            ("play", (50, 50)),
+            ("pause", (50, 50)),
+            ("stop", (50, 50)),
+            ("config", (50, 50)),
+            ("exit", (50, 50)),
+            ("close", (50, 50)),
+            ("left", (60, 80)),
+            ("right", (60, 80)),
+            ("credits", (65, 85)),
+        )
+        for suffix in ("", "_hover", "_pressed")
+    )
+
+    # Themes are long-lived and assets are read every frame; slots keep
+    # instances small and make attribute reads fixed-offset lookups. Asset
+    # slots start empty, so their first read falls through to __getattr__.
+    __slots__ = (
+        "name",
+        "theme_dir",
+        "_loading",
+        "_load_lock",
+        "_preload_thread",
+        "_preloaded",
+        "_files",
+        "_asset_paths",
+        "_display_converted",
+        "_complete",
+        "_bg_cache",
+        "_scaled_bg_cache",
+        "_svg_masters",
+        "_media_table",
+        "_button_map",
+        "_pg_colors",
+        "colors",
+        "button_colors",
+        "_color_resolve_cache",
+        "_version",
+    ) + tuple(spec[0] for spec in _ASSET_SPEC)
 
     def __init__(self, theme_name: str, theme_dir: str):
         """
@@ -54,96 +390,78 @@ class Theme:
         self.name = theme_name
         self.theme_dir = theme_dir
 
-        # Image paths
-        self.background_path = os.path.join(theme_dir, "background.png")
-        self.background_svg_path = os.path.join(theme_dir, "background.svg")
-        self.button_path = os.path.join(theme_dir, "button.png")
-        self.button_hover_path = os.path.join(theme_dir, "button_hover.png")
-        self.button_pressed_path = os.path.join(theme_dir, "button_pressed.png")
-        self.slider_track_path = os.path.join(theme_dir, "slider_track.png")
-        self.slider_track_svg_path = os.path.join(theme_dir, "slider_track.svg")
-        self.slider_track_vertical_path = os.path.join(
-            theme_dir, "slider_track_vertical.png"
-        )
-        self.slider_track_vertical_svg_path = os.path.join(
-            theme_dir, "slider_track_vertical.svg"
+        # Events for asset loads in progress, so a reader waits for an
+        # in-flight decode (eg. from the preload thread) instead of repeating it
+        self._loading: Dict[str, threading.Event] = {}
+        self._load_lock = threading.Lock()
+        self._preload_thread: Optional[threading.Thread] = None
+        # Surfaces decoded by the preload thread but not yet display-converted;
+        # __getattr__ converts and stores them on first access (main thread)
+        self._preloaded: Dict[str, Optional[pygame.Surface]] = {}
+
+        # Names of the files present in the theme directory, read with a
+        # single scandir so asset checks are set lookups, not stat calls.
+        try:
+            with os.scandir(theme_dir) as it:
+                self._files = frozenset(e.name for e in it if e.is_file())
+        except OSError:
+            self._files = frozenset()
+
+        # Resolved asset paths: attribute name -> (png_path, svg_path, size,
+        # svg_first). Surfaces are not decoded here; __getattr__ loads each
+        # one the first time the attribute is read, so themes that are
+        # discovered but never shown cost no image I/O at startup.
+        # Joined once; each asset path is then a plain concatenation
+        prefix = os.path.join(theme_dir, "")
+        self._asset_paths = {
+            attr: (
+                prefix + png,
+                prefix + svg if svg else None,
+                size,
+                svg_first,
+            )
+            for attr, png, svg, size, svg_first in self._ASSET_SPEC
+        }
+        # Set once already-loaded assets were converted by _convert_all()
+        self._display_converted = False
+        # is_complete() verdict, decided once the background has loaded
+        self._complete: Optional[bool] = None
+        # SVG backgrounds rasterized per requested (width, height)
+        self._bg_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        # Window-sized backgrounds from get_background_scaled(), LRU order
+        self._scaled_bg_cache: "OrderedDict[Tuple[int, int], pygame.Surface]" = (
+            OrderedDict()
         )
-        self.slider_knob_path = os.path.join(theme_dir, "slider_knob.png")
-
-        # Media control button paths
-        self.play_button_path = os.path.join(theme_dir, "play_button.png")
-        self.play_button_svg_path = os.path.join(theme_dir, "play_button.svg")
-        self.pause_button_path = os.path.join(theme_dir, "pause_button.png")
-        self.pause_button_svg_path = os.path.join(theme_dir, "pause_button.svg")
-        self.stop_button_path = os.path.join(theme_dir, "stop_button.png")
-        self.stop_button_svg_path = os.path.join(theme_dir, "stop_button.svg")
-        self.config_button_path = os.path.join(theme_dir, "config_button.png")
-        self.config_button_svg_path = os.path.join(theme_dir, "config_button.svg")
-
-        # Exit button paths (icon support)
-        self.exit_button_path = os.path.join(theme_dir, "exit_button.png")
-        self.exit_button_svg_path = os.path.join(theme_dir, "exit_button.svg")
-
-        # Close button paths (for modal close buttons)
-        self.close_button_path = os.path.join(theme_dir, "close_button.png")
-        self.close_button_svg_path = os.path.join(theme_dir, "close_button.svg")
-
-        # Credits button paths
-        self.credits_button_path = os.path.join(theme_dir, "credits_button.png")
-        self.credits_button_svg_path = os.path.join(theme_dir, "credits_button.svg")
-
-        # Navigation button paths
-        self.left_button_path = os.path.join(theme_dir, "left_button.png")
-        self.left_button_svg_path = os.path.join(theme_dir, "left_button.svg")
-        self.right_button_path = os.path.join(theme_dir, "right_button.png")
-        self.right_button_svg_path = os.path.join(theme_dir, "right_button.svg")
-
-        # Loaded images
-        self.background: Optional[pygame.Surface] = None
-        self.button: Optional[pygame.Surface] = None
-        self.button_hover: Optional[pygame.Surface] = None
-        self.button_pressed: Optional[pygame.Surface] = None
-        self.slider_track: Optional[pygame.Surface] = None
-        self.slider_track_vertical: Optional[pygame.Surface] = None
-        self.slider_knob: Optional[pygame.Surface] = None
-
-        # Media control button images
-        self.play_button: Optional[pygame.Surface] = None
-        self.play_button_hover: Optional[pygame.Surface] = None
-        self.play_button_pressed: Optional[pygame.Surface] = None
-        self.pause_button: Optional[pygame.Surface] = None
-        self.pause_button_hover: Optional[pygame.Surface] = None
-        self.pause_button_pressed: Optional[pygame.Surface] = None
-        self.stop_button: Optional[pygame.Surface] = None
-        self.stop_button_hover: Optional[pygame.Surface] = None
-        self.stop_button_pressed: Optional[pygame.Surface] = None
-        self.config_button: Optional[pygame.Surface] = None
-        self.config_button_hover: Optional[pygame.Surface] = None
-        self.config_button_pressed: Optional[pygame.Surface] = None
-        # Exit button image (optional)
-        self.exit_button: Optional[pygame.Surface] = None
-        # Close button image (optional)
-        self.close_button: Optional[pygame.Surface] = None
-        self.close_button_hover: Optional[pygame.Surface] = None
-        self.close_button_pressed: Optional[pygame.Surface] = None
-
-        # Credits button image (optional)
-        self.credits_button: Optional[pygame.Surface] = None
-        self.credits_button_hover: Optional[pygame.Surface] = None
-        self.credits_button_pressed: Optional[pygame.Surface] = None
+        # Master rasters of button SVGs, keyed by path (see _render_svg_at)
+        self._svg_masters: Dict[str, pygame.Surface] = {}
+        # Resolved get_media_button_image() results by (button_type, state),
+        # filled on first lookup so unused buttons are never loaded
+        self._media_table: Dict[Tuple[str, str], Optional[pygame.Surface]] = {}
+        # state -> generic button image, built on the first get_button_image()
+        self._button_map: Optional[Dict[str, Optional[pygame.Surface]]] = None
 
         # Color scheme (defaults). These keys are documented and can be
-        # overridden by a theme.conf file in the theme directory. Use a copy
-        # of DEFAULT_COLORS so each Theme instance can be modified safely.
-        self.colors = dict(self.DEFAULT_COLORS)
+        # overridden by a theme.conf file in the theme directory. Starts as
+        # the shared read-only DEFAULT_COLORS; copied on the first override.
+        self.colors = self.DEFAULT_COLORS
+        # Bumped whenever colors or loaded assets change, so consumers that
+        # cache values read from the theme know when to refresh them.
+        self._version = 0
+        # (color_key, default) -> pygame.Color, filled by get_pg_color()
+        self._pg_colors: Dict[tuple, pygame.Color] = {}
 
         # Load any per-theme configuration (theme.conf) which can override
         # color keys above. This lets theme authors provide easily-editable
         # color and button color values without changing Python code.
         # Keep a separate per-button color map so themes may declare
         # specific colors for individual text-buttons (eg. CLR, ENT, Credits).
-        # Per-button colors structure; map: button_name -> { 'normal': (r,g,b), 'hover': (...), 'pressed': (...) }
-        self.button_colors = {}
+        # Per-button colors structure; map: (button_name, state) -> (r,g,b)
+        # where state is 'normal', 'hover' or 'pressed'
+        self.button_colors: Dict[Tuple[str, str], Tuple[int, int, int]] = {}
+        # Memoized get_button_color() overrides: (button_name, state) -> color
+        # or None when the theme has no override. Colors don't change after
+        # the theme.conf is loaded, so entries never need invalidating.
+        self._color_resolve_cache = {}
 
         try:
             # Use the consolidated loader which reads both [colors] and
@@ -153,259 +471,314 @@ class Theme:
             # Keep defaults on any error reading/parsing the file.
             pass
 
-        # Load images
-        self.load_images()
+    def __getattr__(self, name: str):
+        """Load a theme asset on first access and cache it on the instance.
 
-    
+        Only called when normal attribute lookup fails, i.e. for assets that
+        have not been loaded yet.
+        """
+        if name.startswith("_") or name not in self._asset_paths:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
 
-    def load_images(self) -> None:
-        """Load theme images"""
-        # Try to load background (PNG first, then SVG)
-        # Use a robust loader that falls back to Pillow if pygame can't load PNGs
+        with self._load_lock:
+            surf = self._peek(name)
+            if surf is not _NOT_LOADED:
+                return surf
+            event = self._loading.get(name)
+            owner = event is None
+            if owner:
+                event = self._loading[name] = threading.Event()
+
+        if not owner:
+            event.wait()
+            # Now stored on the instance, or waiting in _preloaded
+            return getattr(self, name)
+
+        surf = None
         try:
-            from src.image_utils import load_image_surface
-        except Exception:
-            load_image_surface = None
-
-        if load_image_surface is not None and os.path.exists(self.background_path):
-            try:
-                self.background = load_image_surface(self.background_path)
-                if self.background is None:
-                    raise RuntimeError("failed to load background via robust loader")
-            except Exception as e:
-                print(f"Error loading background image: {e}")
-        elif SVG_SUPPORT and os.path.exists(self.background_svg_path):
-            try:
-                self.background = self.load_svg_as_surface(self.background_svg_path)
-                print(f"Loaded SVG background: {self.background_svg_path}")
-            except Exception as e:
-                print(f"Error loading background SVG: {e}")
-
-        if os.path.exists(self.button_path) and load_image_surface is not None:
-            try:
-                self.button = load_image_surface(self.button_path)
-                if self.button is None:
-                    raise RuntimeError("failed to load button image")
-            except Exception as e:
-                print(f"Error loading button image: {e}")
-
-        if os.path.exists(self.button_hover_path) and load_image_surface is not None:
-            try:
-                self.button_hover = load_image_surface(self.button_hover_path)
-                if self.button_hover is None:
-                    raise RuntimeError("failed to load button_hover image")
-            except Exception as e:
-                print(f"Error loading button_hover image: {e}")
-
-        if os.path.exists(self.button_pressed_path) and load_image_surface is not None:
-            try:
-                self.button_pressed = load_image_surface(self.button_pressed_path)
-                if self.button_pressed is None:
-                    raise RuntimeError("failed to load button_pressed image")
-            except Exception as e:
-                print(f"Error loading button_pressed image: {e}")
+            surf = self._preloaded.pop(name, _NOT_LOADED)
+            if surf is _NOT_LOADED:
+                surf = self._load_single(name)
+            else:
+                surf = _display_format(surf, name in self._OPAQUE_ASSETS)
+        finally:
+            object.__setattr__(self, name, surf)
+            with self._load_lock:
+                del self._loading[name]
+            event.set()
+        return surf
+
+    def _peek(self, name: str):
+        """Return an asset slot's value without loading it (or _NOT_LOADED)"""
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError:
+            return _NOT_LOADED
 
-        # Load slider track (horizontal)
-        if os.path.exists(self.slider_track_path) and load_image_surface is not None:
-            try:
-                self.slider_track = load_image_surface(self.slider_track_path)
-                if self.slider_track is None:
-                    raise RuntimeError("failed to load slider_track image")
-            except Exception as e:
-                print(f"Error loading slider_track image: {e}")
-        elif os.path.exists(self.slider_track_svg_path) and SVG_SUPPORT:
-            try:
-                self.slider_track = self.load_svg_as_surface(self.slider_track_svg_path)
-                print(f"Loaded SVG slider track: {self.slider_track_svg_path}")
-            except Exception as e:
-                print(f"Error loading slider_track SVG: {e}")
+    def preload_async(self) -> None:
+        """Start decoding the first-frame assets on a background thread.
 
-        # Load vertical slider track
-        if (
-            os.path.exists(self.slider_track_vertical_path)
-            and load_image_surface is not None
-        ):
+        Overlaps image decoding with the rest of application startup; any
+        asset not yet loaded when first read is waited for, not reloaded.
+        The thread only decodes files; display conversion happens on the
+        main thread when the asset is first read.
+        """
+        if self._preload_thread is not None:
+            return
+        self._preload_thread = threading.Thread(
+            target=self._preload_hot_assets,
+            name=f"theme-preload-{self.name}",
+            daemon=True,
+        )
+        self._preload_thread.start()
+
+    def _preload_hot_assets(self) -> None:
+        """Decode the _HOT_ASSETS into _preloaded (runs on the preload thread)"""
+        for name in self._HOT_ASSETS:
+            with self._load_lock:
+                if (
+                    self._peek(name) is not _NOT_LOADED
+                    or name in self._loading
+                    or name in self._preloaded
+                ):
+                    continue
+                event = self._loading[name] = threading.Event()
+            surf = None
             try:
-                self.slider_track_vertical = load_image_surface(
-                    self.slider_track_vertical_path
-                )
-                if self.slider_track_vertical is None:
-                    raise RuntimeError("failed to load slider_track_vertical image")
+                surf = self._load_single(name)
             except Exception as e:
-                print(f"Error loading slider_track_vertical image: {e}")
-        elif os.path.exists(self.slider_track_vertical_svg_path) and SVG_SUPPORT:
-            try:
-                self.slider_track_vertical = self.load_svg_as_surface(
-                    self.slider_track_vertical_svg_path
-                )
-                print(
-                    f"Loaded vertical SVG slider track: {self.slider_track_vertical_svg_path}"
+                print(f"Error preloading {name} image: {e}")
+            finally:
+                with self._load_lock:
+                    self._preloaded[name] = surf
+                    del self._loading[name]
+                event.set()
+
+    def _convert_all(self) -> None:
+        """Convert assets loaded before the display existed to its format.
+
+        Assets loaded after the display is created are converted as they
+        load, so this only needs to run once per theme. Assets still being
+        preloaded are not waited for; they are converted on first read.
+        """
+        if self._display_converted or pygame.display.get_surface() is None:
+            return
+        for name in self._asset_paths:
+            surf = self._peek(name)
+            if surf is not None and surf is not _NOT_LOADED:
+                object.__setattr__(
+                    self, name, _display_format(surf, name in self._OPAQUE_ASSETS)
                 )
-            except Exception as e:
-                print(f"Error loading slider_track_vertical SVG: {e}")
-
-        if os.path.exists(self.slider_knob_path) and load_image_surface is not None:
+        # Resolved media images may reference the pre-conversion surfaces
+        self._media_table.clear()
+        self._button_map = None
+        self._scaled_bg_cache.clear()
+        self._display_converted = True
+        self._version += 1
+
+    def load_images(self, parallel: bool = True) -> None:
+        """Load every theme image now rather than on first access.
+
+        Assets with files are decoded on a small thread pool (file reads and
+        SDL_image decodes release the GIL). With parallel=False, or if the
+        pool cannot be started, they are loaded one by one instead.
+        """
+        names = [
+            name
+            for name in self._asset_paths
+            if self._peek(name) is _NOT_LOADED and self._asset_present(name)
+        ]
+        if parallel and len(names) > 1:
             try:
-                self.slider_knob = load_image_surface(self.slider_knob_path)
-                if self.slider_knob is None:
-                    raise RuntimeError("failed to load slider_knob image")
-            except Exception as e:
-                print(f"Error loading slider_knob image: {e}")
-
-        # Load media control buttons (PNG first, then SVG)
-        self._load_media_button("play", self.play_button_path, self.play_button_svg_path)
-        self._load_media_button(
-            "pause", self.pause_button_path, self.pause_button_svg_path
-        )
-        self._load_media_button(
-            "stop", self.stop_button_path, self.stop_button_svg_path
-        )
-        self._load_media_button(
-            "config", self.config_button_path, self.config_button_svg_path
-        )
-
-        # Load exit button if provided by the theme
-        self._load_media_button(
-            "exit", self.exit_button_path, self.exit_button_svg_path
+                with ThreadPoolExecutor(max_workers=min(8, len(names))) as ex:
+                    list(ex.map(lambda name: getattr(self, name), names))
+            except RuntimeError:
+                pass  # eg. interpreter shutting down; load serially below
+            # Pool threads only decode; convert their results here
+            if _on_main_thread() and pygame.display.get_surface() is not None:
+                for name in names:
+                    surf = self._peek(name)
+                    if surf is not None and surf is not _NOT_LOADED:
+                        object.__setattr__(
+                            self,
+                            name,
+                            _display_format(surf, name in self._OPAQUE_ASSETS),
+                        )
+        # Anything not loaded above (absent files resolve to None here)
+        for name in self._asset_paths:
+            getattr(self, name)
+
+    def _asset_present(self, name: str) -> bool:
+        """Return True if a PNG or SVG file exists for the asset"""
+        png_path, svg_path, _, _ = self._asset_paths[name]
+        return os.path.basename(png_path) in self._files or (
+            svg_path is not None and os.path.basename(svg_path) in self._files
         )
 
-        # Load close button variants if provided
-        self._load_media_button(
-            "close", self.close_button_path, self.close_button_svg_path
-        )
+    def _load_single(self, name: str) -> Optional[pygame.Surface]:
+        """Load a single asset from the asset table (PNG/SVG order per entry)"""
+        png_path, svg_path, size, svg_first = self._asset_paths[name]
+        if svg_first:
+            surf = self._load_svg_asset(name, svg_path, size)
+            if surf is None:
+                surf = self._load_png_asset(name, png_path, size)
+        else:
+            surf = self._load_png_asset(name, png_path, size)
+            if surf is None:
+                surf = self._load_svg_asset(name, svg_path, size)
+        return surf
 
-        # Load navigation buttons (PNG first, then SVG)
-        self._load_media_button(
-            "left", self.left_button_path, self.left_button_svg_path, size=(60, 80)
-        )
-        self._load_media_button(
-            "right", self.right_button_path, self.right_button_svg_path, size=(60, 80)
-        )
+    def _load_png_asset(
+        self, name: str, png_path: str, size: Optional[Tuple[int, int]]
+    ) -> Optional[pygame.Surface]:
+        """Load a PNG asset, returning None if missing or unreadable"""
+        if os.path.basename(png_path) not in self._files:
+            return None
+        try:
+            surf = _cached_load(png_path, size, name in self._OPAQUE_ASSETS)
+            if surf is None:
+                raise RuntimeError(f"failed to load {name} image")
+            return surf
+        except Exception as e:
+            print(f"Error loading {name} image: {e}")
+            return None
 
-        # Load exit button and its variants (PNG first then SVG)
-        self._load_media_button(
-            "exit", self.exit_button_path, self.exit_button_svg_path
-        )
+    def _load_svg_asset(
+        self, name: str, svg_path: Optional[str], size: Optional[Tuple[int, int]]
+    ) -> Optional[pygame.Surface]:
+        """Rasterize an SVG asset, returning None if missing or unsupported"""
+        if not (SVG_SUPPORT and svg_path and os.path.basename(svg_path) in self._files):
+            return None
+        try:
+            if size:
+                surf = self._render_svg_at(svg_path, size)
+            else:
+                surf = self.load_svg_as_surface(svg_path)
+            return _display_format(surf, name in self._OPAQUE_ASSETS)
+        except Exception as e:
+            print(f"Error loading {name} SVG: {e}")
+            return None
 
-        # Load credits button and its variants (PNG first then SVG). Use
-        # the requested 65x85 size so the artwork maps to the credit button
-        # dimensions used throughout the UI and avoids runtime scaling.
-        self._load_media_button(
-            "credits", self.credits_button_path, self.credits_button_svg_path, size=(65, 85)
-        )
+    def _render_svg_at(self, svg_path: str, size: Tuple[int, int]) -> pygame.Surface:
+        """Get an SVG at a button size.
 
-        # Load exit button and its variants (PNG first then SVG)
-        self._load_media_button(
-            "exit", self.exit_button_path, self.exit_button_svg_path
-        )
+        With cairosvg, which renders vectors at the requested resolution, a
+        square target is a smoothscale of one cached master raster. The other
+        backends rasterize at the SVG's intrinsic size (SDL_image) or would
+        distort a non-square target, so those render directly at `size`.
+        """
+        master_w, master_h = self._SVG_MASTER_SIZE
+        if not CAIROSVG_SUPPORT or size[0] * master_h != size[1] * master_w:
+            return self.load_svg_as_surface(svg_path, *size)
+        master = self._svg_masters.get(svg_path)
+        if master is None:
+            master = self.load_svg_as_surface(svg_path, *self._SVG_MASTER_SIZE)
+            self._svg_masters[svg_path] = master
+        if master.get_size() == tuple(size):
+            return master
+        return pygame.transform.smoothscale(master, size)
 
-    def _load_media_button(
-        self, button_type: str, png_path: str, svg_path: str, size: Tuple[int, int] = (50, 50)
-    ) -> None:
-        """Load media button image (PNG first, then SVG)"""
-        button_attr = f"{button_type}_button"
-        hover_attr = f"{button_type}_button_hover"
-        pressed_attr = f"{button_type}_button_pressed"
+    def load_svg_as_surface(
+        self,
+        svg_path: str,
+        width: int = None,
+        height: int = None,
+        persist: bool = True,
+    ) -> pygame.Surface:
+        """Convert SVG to pygame surface, using the on-disk raster cache.
 
-        # Try PNG first for normal state
-        if os.path.exists(png_path):
+        With persist=False the raster is neither read from nor written to the
+        disk cache (used for window-sized backgrounds, whose sizes vary).
+        """
+        if not SVG_SUPPORT:
+            raise ImportError("cairosvg or svglib/reportlab required for SVG support")
+        if not persist:
+            return self._render_svg(svg_path, width, height)
+
+        # Cache key covers the file identity, its mtime and the output size
+        key = hashlib.blake2b(
+            f"{os.path.abspath(svg_path)}:{os.stat(svg_path).st_mtime_ns}:"
+            f"{width}x{height}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        cache_path = os.path.join(_SVG_CACHE_DIR, f"{key}.png")
+        if os.path.exists(cache_path):
             try:
-                # Import the robust loader locally (this method may be called
-                # from a different scope where load_image_surface isn't defined)
-                try:
-                    from src.image_utils import load_image_surface
-                except Exception:
-                    load_image_surface = None
-
-                if load_image_surface is not None:
-                    # Load media assets at the UI's intended media control size
-                    # to avoid rescaling at render-time and preserve crispness.
-                    surf = load_image_surface(png_path, size=size)
-                else:
-                    surf = pygame.image.load(png_path)
-
-                if surf is None:
-                    raise RuntimeError("failed to load PNG for button")
-
-                setattr(self, button_attr, surf)
-            except Exception as e:
-                print(f"Error loading {button_type} button PNG: {e}")
+                return pygame.image.load(cache_path)
+            except Exception:
+                pass  # Corrupt/unreadable cache entry; render again below
 
-        # Try SVG if PNG failed or doesn't exist
-        # Try SVG for normal state
-        if SVG_SUPPORT and os.path.exists(svg_path):
-            try:
-                # Load SVG at standard button size (64x64)
-                # Render SVG at the UI's target media control size
-                svg_surface = self.load_svg_as_surface(svg_path, size[0], size[1])
-                setattr(self, button_attr, svg_surface)
-            except Exception as e:
-                print(f"Error loading {button_type} button SVG: {e}")
+        surface = self._render_svg(svg_path, width, height)
 
-        # Hover/pressed variants: look for PNG/SVG with _hover/_pressed suffixes
-        # Hover PNG
-        png_hover = png_path.replace('.png', '_hover.png')
-        svg_hover = svg_path.replace('.svg', '_hover.svg')
-        if os.path.exists(png_hover):
-            try:
+        # Best effort: write to a uniquely named temp file and rename so
+        # concurrent readers (and other loader threads) never see a partially
+        # written PNG.
+        tmp_path = None
+        try:
+            os.makedirs(_SVG_CACHE_DIR, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=_SVG_CACHE_DIR, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+            pygame.image.save(surface, tmp_path, "png")
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+            _prune_svg_cache()
+        except Exception:
+            pass
+        finally:
+            if tmp_path is not None:
                 try:
-                    from src.image_utils import load_image_surface
-                except Exception:
-                    load_image_surface = None
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        return surface
 
-                if load_image_surface is not None:
-                    surf = load_image_surface(png_hover, size=size)
-                else:
-                    surf = pygame.image.load(png_hover)
-
-                setattr(self, hover_attr, surf)
-            except Exception as e:
-                print(f"Error loading {button_type} hover PNG: {e}")
-        elif SVG_SUPPORT and os.path.exists(svg_hover):
+    def _render_svg(
+        self, svg_path: str, width: int = None, height: int = None
+    ) -> pygame.Surface:
+        """Rasterize an SVG file (cairosvg, then SDL_image, then svglib)"""
+        if CAIROSVG_SUPPORT:
             try:
-                surf = self.load_svg_as_surface(svg_hover, size[0], size[1])
-                setattr(self, hover_attr, surf)
+                # Rasterize directly at the target size and decode the PNG
+                # bytes; no intermediate PIL image or raw buffer copies.
+                png_bytes = cairosvg.svg2png(
+                    url=svg_path, output_width=width, output_height=height
+                )
+                return pygame.image.load(io.BytesIO(png_bytes), "svg.png")
             except Exception as e:
-                print(f"Error loading {button_type} hover SVG: {e}")
+                if not (PYGAME_SVG_SUPPORT or SVGLIB_SUPPORT):
+                    print(f"Failed to convert SVG to surface: {e}")
+                    raise
 
-        # Pressed PNG
-        png_pressed = png_path.replace('.png', '_pressed.png')
-        svg_pressed = svg_path.replace('.svg', '_pressed.svg')
-        if os.path.exists(png_pressed):
+        if PYGAME_SVG_SUPPORT:
             try:
-                try:
-                    from src.image_utils import load_image_surface
-                except Exception:
-                    load_image_surface = None
-
-                if load_image_surface is not None:
-                    surf = load_image_surface(png_pressed, size=size)
-                else:
-                    surf = pygame.image.load(png_pressed)
-
-                setattr(self, pressed_attr, surf)
+                # SDL_image renders at the SVG's intrinsic size
+                surf = pygame.image.load(svg_path)
+                if width and height and surf.get_size() != (width, height):
+                    surf = pygame.transform.smoothscale(surf, (width, height))
+                return surf
             except Exception as e:
-                print(f"Error loading {button_type} pressed PNG: {e}")
-        elif SVG_SUPPORT and os.path.exists(svg_pressed):
-            try:
-                surf = self.load_svg_as_surface(svg_pressed, size[0], size[1])
-                setattr(self, pressed_attr, surf)
-            except Exception as e:
-                print(f"Error loading {button_type} pressed SVG: {e}")
-
-    def load_svg_as_surface(
-        self, svg_path: str, width: int = None, height: int = None
-    ) -> pygame.Surface:
-        """Convert SVG to pygame surface using svglib"""
-        if not SVG_SUPPORT:
-            raise ImportError("svglib/reportlab not available for SVG support")
+                if not SVGLIB_SUPPORT:
+                    print(f"Failed to convert SVG to surface: {e}")
+                    raise
 
         try:
+            if not _import_svglib():
+                raise ImportError(_SVGLIB_ERROR)
+
             # Parse SVG file
             drawing = svg2rlg(svg_path)
 
-            # Set dimensions if provided
-            if width and height:
+            # Set dimensions if provided; drawings authored at the target
+            # size (eg. 50x50 icons) need no transform
+            if (
+                width
+                and height
+                and (int(drawing.width) != width or int(drawing.height) != height)
+            ):
                 # Scale drawing to desired size
                 scale_x = width / drawing.width if drawing.width else 1
                 scale_y = height / drawing.height if drawing.height else 1
@@ -413,57 +786,138 @@ class Theme:
                 drawing.width = width
                 drawing.height = height
 
-            # Render to PIL image
+            # Render to PIL image, in a mode frombuffer understands
             pil_image = renderPM.drawToPIL(drawing)
+            if pil_image.mode not in ("RGB", "RGBA"):
+                pil_image = pil_image.convert("RGBA")
 
-            # Convert PIL image to pygame surface
+            # Wrap the PIL pixels without a second copy; the surface keeps
+            # a reference to the buffer, and _display_format() copies it
+            # into a display-format surface once a display exists
             mode = pil_image.mode
             size = pil_image.size
             raw = pil_image.tobytes()
 
-            return pygame.image.fromstring(raw, size, mode)
+            return _display_format(pygame.image.frombuffer(raw, size, mode))
         except Exception as e:
             print(f"Failed to convert SVG to surface: {e}")
             raise
 
     def is_complete(self) -> bool:
         """Check if theme has all essential images"""
-        return self.background is not None
+        complete = self._complete
+        if complete is None:
+            complete = self._complete = self.background is not None
+        return complete
 
     def get_background(
         self, width: int = None, height: int = None
     ) -> Optional[pygame.Surface]:
         """Get background image, optionally scaled from SVG"""
         # If we have SVG and specific dimensions requested, reload at that size
+        svg_path = self._asset_paths["background"][1]
         if (
             SVG_SUPPORT
-            and os.path.exists(self.background_svg_path)
+            and os.path.basename(svg_path) in self._files
             and width is not None
             and height is not None
         ):
+            key = (width, height)
+            cached = self._bg_cache.get(key)
+            if cached is not None:
+                return cached
             try:
-                return self.load_svg_as_surface(self.background_svg_path, width, height)
+                # Window-sized: kept in memory only, not in the disk cache
+                surf = _display_format(
+                    self.load_svg_as_surface(svg_path, width, height, persist=False)
+                )
+                if len(self._bg_cache) >= self._BG_CACHE_MAX:
+                    # Evict the oldest size (dicts keep insertion order)
+                    del self._bg_cache[next(iter(self._bg_cache))]
+                self._bg_cache[key] = surf
+                return surf
             except Exception as e:
                 print(f"Error loading scaled SVG background: {e}")
 
         return self.background
 
+    def get_background_scaled(self, size: Tuple[int, int]) -> Optional[pygame.Surface]:
+        """Get the background at exactly `size`, cached per size.
+
+        SVG backgrounds are rasterized at the size; bitmaps are smoothscaled
+        once and converted, so per-frame drawing is a plain blit.
+        """
+        size = tuple(size)
+        cached = self._scaled_bg_cache.get(size)
+        if cached is not None:
+            self._scaled_bg_cache.move_to_end(size)
+            return cached
+
+        bg = self.get_background(*size)
+        if bg is None:
+            return None
+        if bg.get_size() != size:
+            try:
+                bg = pygame.transform.smoothscale(bg, size)
+            except ValueError:
+                # smoothscale only handles 24/32-bit surfaces
+                bg = pygame.transform.scale(bg, size)
+            bg = _display_format(bg, opaque=True)
+
+        self._scaled_bg_cache[size] = bg
+        if len(self._scaled_bg_cache) > self._BG_CACHE_MAX:
+            self._scaled_bg_cache.popitem(last=False)
+        return bg
+
     def get_button_image(self, state: str = "normal") -> Optional[pygame.Surface]:
         """Get button image for a given state"""
-        if state == "hover" and self.button_hover:
-            return self.button_hover
-        elif state == "pressed" and self.button_pressed:
-            return self.button_pressed
-        return self.button
+        button_map = self._button_map
+        if button_map is None:
+            button_map = self._rebuild_button_map()
+        return button_map.get(state, self.button)
+
+    def _rebuild_button_map(self) -> Dict[str, Optional[pygame.Surface]]:
+        """Resolve each button state to its image, falling back to normal"""
+        button = self.button
+        self._button_map = {
+            "normal": button,
+            "hover": self.button_hover or button,
+            "pressed": self.button_pressed or button,
+        }
+        return self._button_map
 
     def get_color(
-        self, color_key: str, default: Tuple[int, int, int] = None
+        self, color_key: str, default: Tuple[int, int, int] = _DEFAULT_GRAY
     ) -> Tuple[int, int, int]:
         """Get color from theme"""
-        if default is None:
-            default = (128, 128, 128)
         return self.colors.get(color_key, default)
 
+    def set_color(self, color_key: str, value: Tuple[int, int, int]) -> None:
+        """Set a theme color, copying the shared defaults on first write"""
+        if self.colors is Theme.DEFAULT_COLORS:
+            self.colors = dict(Theme.DEFAULT_COLORS)
+        self.colors[color_key] = value
+        self._pg_colors.clear()
+        self._version += 1
+
+    def get_pg_color(
+        self, color_key: str, default: Tuple[int, int, int] = None
+    ) -> pygame.Color:
+        """Get color from theme as a cached pygame.Color.
+
+        For per-frame drawing code; the Color is shared between callers and
+        must not be modified.
+        """
+        if default is None:
+            default = _DEFAULT_GRAY
+        cache_key = (color_key, default)
+        try:
+            return self._pg_colors[cache_key]
+        except KeyError:
+            color = pygame.Color(*self.get_color(color_key, default))
+            self._pg_colors[cache_key] = color
+            return color
+
     def get_media_button_image(self, button_type: str, state: str = "normal") -> Optional[pygame.Surface]:
         """Get media button image by type and state (normal | hover | pressed).
 
@@ -475,6 +929,12 @@ class Theme:
         if state not in ("normal", "hover", "pressed"):
             state = "normal"
 
+        key = (button_type, state)
+        try:
+            return self._media_table[key]
+        except KeyError:
+            pass
+
         if state == "normal":
             attr = f"{button_type}_button"
         elif state == "hover":
@@ -488,6 +948,7 @@ class Theme:
         if img is None and state != "normal":
             img = getattr(self, f"{button_type}_button", None)
 
+        self._media_table[key] = img
         return img
 
     # Theme config helpers (moved inside Theme): parsing & loader
@@ -497,52 +958,43 @@ class Theme:
         Accepts hex (#RRGGBB) or comma-separated r,g,b integers.
         Returns a (r,g,b) tuple or None on parse failure.
         """
-        s = s.strip()
-        if not s:
+        m = _COLOR_RE.match(s)
+        if m is None:
             return None
-        if s.startswith("#") and len(s) == 7:
-            try:
-                return (int(s[1:3], 16), int(s[3:5], 16), int(s[5:7], 16))
-            except Exception:
-                return None
-        parts = [p.strip() for p in s.split(',') if p.strip()]
-        if len(parts) == 3:
-            try:
-                return (int(parts[0]), int(parts[1]), int(parts[2]))
-            except Exception:
-                return None
-        return None
+        hex_value = m.group(1)
+        if hex_value is not None:
+            return (
+                int(hex_value[0:2], 16),
+                int(hex_value[2:4], 16),
+                int(hex_value[4:6], 16),
+            )
+        return (int(m.group(2)), int(m.group(3)), int(m.group(4)))
 
     def _load_theme_conf(self) -> None:
         """Load theme colors from theme.conf (INI) inside theme_dir.
 
         Supported section: [colors]
         """
-        import configparser
-
-        conf_file = os.path.join(self.theme_dir, "theme.conf")
-        if not os.path.exists(conf_file):
+        if "theme.conf" not in self._files:
             return
-        parser = configparser.ConfigParser()
-        try:
-            parser.read(conf_file)
-        except Exception:
+        sections = _load_conf_cached(os.path.join(self.theme_dir, "theme.conf"))
+        if sections is None:
             return
         # Parse the colors section if present
-        if "colors" in parser:
-            for key, val in parser.items("colors"):
+        if "colors" in sections:
+            for key, val in sections["colors"].items():
                 if key in self.colors:
                     parsed = self._parse_color_value(val)
                     if parsed:
-                        self.colors[key] = parsed
+                        self.set_color(key, parsed)
 
         # Parse per-button color overrides: support either [button_colors]
         # or a legacy [buttons] section to be flexible.
         for section_name in ("button_colors", "buttons"):
-            if section_name in parser:
-                for key, val in parser.items(section_name):
+            if section_name in sections:
+                for key, val in sections[section_name].items():
                     # Normalize key to lowercase to make lookups case-insensitive
-                    raw = key.strip().lower()
+                    raw = sys.intern(key.strip().lower())
                     parsed = self._parse_color_value(val)
                     if not parsed:
                         continue
@@ -556,11 +1008,9 @@ class Theme:
                     elif raw.endswith("_pressed"):
                         base = raw[: -len("_pressed")]
                         state = "pressed"
+                    base = sys.intern(base)
 
-                    if base not in self.button_colors:
-                        self.button_colors[base] = {}
-
-                    self.button_colors[base][state] = parsed
+                    self.button_colors[(base, state)] = parsed
 
         return
 
@@ -578,21 +1028,24 @@ class Theme:
         if not button_name:
             return default
 
-        name = button_name.strip().lower()
-
-        entry = self.button_colors.get(name)
-        if isinstance(entry, dict):
-            # Prefer requested state, fallback to normal, then default
-            if state in entry:
-                return entry[state]
-            if "normal" in entry:
-                return entry["normal"]
+        cache_key = (button_name, state)
+        try:
+            resolved = self._color_resolve_cache[cache_key]
+        except KeyError:
+            resolved = self._resolve_button_color(button_name, state)
+            self._color_resolve_cache[cache_key] = resolved
 
-        # Support legacy flat mapping where entry was a tuple
-        if entry and isinstance(entry, tuple):
-            return entry
+        return default if resolved is None else resolved
 
-        return default
+    def _resolve_button_color(
+        self, button_name: str, state: str
+    ) -> Optional[Tuple[int, int, int]]:
+        """Return the theme's override color for a button, or None"""
+        name = button_name.strip().lower()
+        # Prefer requested state, fallback to normal
+        return self.button_colors.get((name, state)) or self.button_colors.get(
+            (name, "normal")
+        )
 
     # ---------- theme.conf helpers (move into Theme) ----------
 
@@ -615,6 +1068,15 @@ class ThemeManager:
         self.themes_dir = themes_dir
         self.themes: Dict[str, Theme] = {}
         self.current_theme: Optional[Theme] = None
+        # (directory mtime, theme.conf signature) each theme was built at;
+        # unchanged themes are reused by discover_themes() instead of being
+        # reconstructed. The conf is included because editing it in place
+        # does not touch the directory mtime.
+        self._theme_mtimes: Dict[str, tuple] = {}
+        # Bumped whenever self.themes is replaced; get_available_themes()
+        # keeps its sorted result until the version moves on
+        self._themes_version = 0
+        self._sorted_cache: Tuple[int, Tuple[str, ...]] = (-1, ())
 
         self._ensure_themes_directory()
         self.discover_themes()
@@ -626,20 +1088,52 @@ class ThemeManager:
             print(f"Created themes directory: {self.themes_dir}")
 
     def discover_themes(self) -> None:
-        """Discover available themes"""
-        self.themes = {}
-
+        """Discover available themes, rebuilding only new or changed ones"""
         if not os.path.exists(self.themes_dir):
+            self.themes = {}
+            self._theme_mtimes = {}
+            self._themes_version += 1
             print(f"Themes directory not found: {self.themes_dir}")
             return
 
         try:
-            for item in os.listdir(self.themes_dir):
-                theme_path = os.path.join(self.themes_dir, item)
-                if os.path.isdir(theme_path):
-                    theme = Theme(item, theme_path)
-                    self.themes[item] = theme
+            # One directory read; DirEntry.is_dir() and stat() reuse it
+            # rather than issuing separate stat calls per entry
+            with os.scandir(self.themes_dir) as it:
+                entries = [entry for entry in it if entry.is_dir()]
+            dirs = [(entry.name, entry.path) for entry in entries]
+
+            themes: Dict[str, Theme] = {}
+            mtimes: Dict[str, tuple] = {}
+            stale = []
+            for entry in entries:
+                item, theme_path = entry.name, entry.path
+                mtimes[item] = (
+                    entry.stat().st_mtime_ns,
+                    _conf_signature(os.path.join(theme_path, "theme.conf")),
+                )
+                previous = self.themes.get(item)
+                if (
+                    previous is not None
+                    and self._theme_mtimes.get(item) == mtimes[item]
+                ):
+                    themes[item] = previous
+                else:
+                    stale.append((item, theme_path))
+
+            if stale:
+                # Build themes concurrently: construction is dominated by file
+                # I/O (theme.conf reads, stats) which releases the GIL.
+                with ThreadPoolExecutor(max_workers=min(8, len(stale))) as ex:
+                    built = list(ex.map(lambda d: Theme(d[0], d[1]), stale))
+                for (item, _), theme in zip(stale, built):
+                    themes[item] = theme
                     print(f"Found theme: {item}")
+
+            # Keep the directory listing order; vanished themes drop out
+            self.themes = {item: themes[item] for item, _ in dirs}
+            self._theme_mtimes = mtimes
+            self._themes_version += 1
         except Exception as e:
             print(f"Error discovering themes: {e}")
 
@@ -660,6 +1154,9 @@ class ThemeManager:
         theme = self.get_theme(theme_name)
         if theme:
             self.current_theme = theme
+            # Blits of the active theme's images should hit the fast path
+            theme._convert_all()
+            theme.preload_async()
             print(f"Theme changed to: {theme_name}")
             return True
         else:
@@ -670,39 +1167,51 @@ class ThemeManager:
         """Get the current active theme"""
         return self.current_theme
 
-    def get_available_themes(self) -> list:
-        """Get list of available theme names"""
-        return sorted(list(self.themes.keys()))
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the process-wide decoded image and theme.conf caches"""
+        with _SURFACE_CACHE_LOCK:
+            _SURFACE_CACHE.clear()
+        _CONF_CACHE.clear()
+
+    def convert_current_theme(self) -> None:
+        """Convert the current theme's loaded images once a display exists"""
+        if self.current_theme is not None:
+            self.current_theme._convert_all()
+
+    def get_available_themes(self) -> Tuple[str, ...]:
+        """Get sorted names of available themes"""
+        version, names = self._sorted_cache
+        if version != self._themes_version:
+            names = tuple(sorted(self.themes))
+            self._sorted_cache = (self._themes_version, names)
+        return names
+
+    # Placeholder images written into new themes: (file, size, color key)
+    _PLACEHOLDER_IMAGES = (
+        ("background.png", (1000, 700), "background"),
+        ("button.png", (100, 50), "button"),
+        ("button_hover.png", (100, 50), "button_hover"),
+        ("button_pressed.png", (100, 50), "button_pressed"),
+    )
+
+    def _write_placeholder_images(self, theme_dir: str) -> None:
+        """Save the solid-color placeholder images into theme_dir"""
+        for filename, size, color_key in self._PLACEHOLDER_IMAGES:
+            data = _placeholder_png(size, Theme.DEFAULT_COLORS[color_key])
+            with open(os.path.join(theme_dir, filename), "wb") as f:
+                f.write(data)
 
     def create_default_theme(self) -> None:
         """Create a default theme with placeholder images"""
+        if "default" in self.themes:
+            return
         default_dir = os.path.join(self.themes_dir, "default")
         if not os.path.exists(default_dir):
             os.makedirs(default_dir)
 
-            # Create a simple background surface
-            bg_surface = pygame.Surface((1000, 700))
-            bg_surface.fill((32, 32, 32))
-            pygame.image.save(bg_surface, os.path.join(default_dir, "background.png"))
-
-            # Create simple button surface
-            btn_surface = pygame.Surface((100, 50))
-            btn_surface.fill((64, 64, 64))
-            pygame.image.save(btn_surface, os.path.join(default_dir, "button.png"))
-
-            # Create button hover surface
-            btn_hover_surface = pygame.Surface((100, 50))
-            btn_hover_surface.fill((100, 100, 100))
-            pygame.image.save(
-                btn_hover_surface, os.path.join(default_dir, "button_hover.png")
-            )
-
-            # Create button pressed surface
-            btn_pressed_surface = pygame.Surface((100, 50))
-            btn_pressed_surface.fill((50, 50, 50))
-            pygame.image.save(
-                btn_pressed_surface, os.path.join(default_dir, "button_pressed.png")
-            )
+            # Background and button placeholders in the default colors
+            self._write_placeholder_images(default_dir)
 
             print(f"Created default theme in: {default_dir}")
             # Create a simple theme.conf so themes are editable and install
@@ -710,27 +1219,41 @@ class ThemeManager:
             # canonical Theme.DEFAULT_COLORS rather than referencing
             # ThemeManager.self.colors which doesn't exist.
             conf_path = os.path.join(default_dir, "theme.conf")
+            # Use Theme.DEFAULT_COLORS to avoid relying on instance state
+            colors_text = "\n".join(
+                f"{k} = {v[0]},{v[1]},{v[2]}" for k, v in Theme.DEFAULT_COLORS.items()
+            )
             try:
                 with open(conf_path, "w", encoding="utf-8") as f:
-                    f.write("[colors]\n")
-                    # Use Theme.DEFAULT_COLORS to avoid relying on instance state
-                    for k, v in Theme.DEFAULT_COLORS.items():
-                        f.write(f"{k} = {v[0]},{v[1]},{v[2]}\n")
-
                     # Provide an example section for per-button colors. This
                     # allows theme authors to give specific colors for named
                     # text buttons (eg. CLR, ENT, Credits) using [button_colors]
-                    f.write("\n[button_colors]\n")
-                    f.write("credits = 255,215,0\n")
-                    f.write("credits_hover = 255,230,128\n")
-                    f.write("credits_pressed = 200,150,0\n")
-                    f.write("clr = 200,50,50\n")
-                    f.write("clr_hover = 230,100,100\n")
-                    f.write("ent = 100,200,100\n")
+                    f.write(
+                        f"[colors]\n{colors_text}\n"
+                        "\n[button_colors]\n"
+                        "credits = 255,215,0\n"
+                        "credits_hover = 255,230,128\n"
+                        "credits_pressed = 200,150,0\n"
+                        "clr = 200,50,50\n"
+                        "clr_hover = 230,100,100\n"
+                        "ent = 100,200,100\n"
+                    )
             except Exception:
                 pass
 
-            self.discover_themes()
+            # Register just the new theme; the others are unchanged, so a
+            # full rediscovery would only re-stat them
+            self._register_theme("default", default_dir)
+
+    def _register_theme(self, name: str, theme_path: str) -> None:
+        """Build and register a single theme as discover_themes() would"""
+        self.themes[name] = Theme(name, theme_path)
+        self._theme_mtimes[name] = (
+            os.stat(theme_path).st_mtime_ns,
+            _conf_signature(os.path.join(theme_path, "theme.conf")),
+        )
+        self._themes_version += 1
+        print(f"Found theme: {name}")
 
     def create_theme(
         self,
@@ -760,53 +1283,54 @@ class ThemeManager:
 
             # Create simple placeholder images (same shapes as default)
             try:
-                bg_surface = pygame.Surface((1000, 700))
-                bg_surface.fill(Theme.DEFAULT_COLORS.get("background", (32, 32, 32)))
-                pygame.image.save(bg_surface, os.path.join(theme_dir, "background.png"))
-
-                btn_surface = pygame.Surface((100, 50))
-                btn_surface.fill(Theme.DEFAULT_COLORS.get("button", (64, 64, 64)))
-                pygame.image.save(btn_surface, os.path.join(theme_dir, "button.png"))
-
-                btn_hover_surface = pygame.Surface((100, 50))
-                btn_hover_surface.fill(Theme.DEFAULT_COLORS.get("button_hover", (100, 100, 100)))
-                pygame.image.save(btn_hover_surface, os.path.join(theme_dir, "button_hover.png"))
-
-                btn_pressed_surface = pygame.Surface((100, 50))
-                btn_pressed_surface.fill(Theme.DEFAULT_COLORS.get("button_pressed", (50, 50, 50)))
-                pygame.image.save(btn_pressed_surface, os.path.join(theme_dir, "button_pressed.png"))
+                self._write_placeholder_images(theme_dir)
             except Exception:
                 # If writing images fails, continue — theme.conf is most important
                 pass
 
             # Write theme.conf
+            # Colors section: use provided colors overriding defaults
+            lines = ["[colors]"]
+            base_colors = dict(Theme.DEFAULT_COLORS)
+            if colors:
+                # replace only known keys
+                for k, v in colors.items():
+                    if (
+                        k in base_colors
+                        and isinstance(v, (tuple, list))
+                        and len(v) == 3
+                    ):
+                        base_colors[k] = (int(v[0]), int(v[1]), int(v[2]))
+
+            lines.extend(f"{k} = {v[0]},{v[1]},{v[2]}" for k, v in base_colors.items())
+
+            # button_colors section: support either simple tuple (normal) or
+            # nested dicts { 'normal':(...), 'hover':(...), 'pressed':(...) }
+            if button_colors:
+                lines.append("")
+                lines.append("[button_colors]")
+                for btn, col in button_colors.items():
+                    if isinstance(col, (tuple, list)) and len(col) == 3:
+                        lines.append(
+                            f"{btn} = {int(col[0])},{int(col[1])},{int(col[2])}"
+                        )
+                    elif isinstance(col, dict):
+                        # write known states if provided
+                        for st in ("normal", "hover", "pressed"):
+                            if (
+                                st in col
+                                and isinstance(col[st], (tuple, list))
+                                and len(col[st]) == 3
+                            ):
+                                keyname = btn if st == "normal" else f"{btn}_{st}"
+                                lines.append(
+                                    f"{keyname} = {int(col[st][0])},{int(col[st][1])},{int(col[st][2])}"
+                                )
+
+            # Build the whole file first and write it in one call
             conf_path = os.path.join(theme_dir, "theme.conf")
             with open(conf_path, "w", encoding="utf-8") as f:
-                # Colors section: use provided colors overriding defaults
-                f.write("[colors]\n")
-                base_colors = dict(Theme.DEFAULT_COLORS)
-                if colors:
-                    # replace only known keys
-                    for k, v in colors.items():
-                        if k in base_colors and isinstance(v, (tuple, list)) and len(v) == 3:
-                            base_colors[k] = (int(v[0]), int(v[1]), int(v[2]))
-
-                for k, v in base_colors.items():
-                    f.write(f"{k} = {v[0]},{v[1]},{v[2]}\n")
-
-                # button_colors section: support either simple tuple (normal) or
-                # nested dicts { 'normal':(...), 'hover':(...), 'pressed':(...) }
-                if button_colors:
-                    f.write("\n[button_colors]\n")
-                    for btn, col in button_colors.items():
-                        if isinstance(col, (tuple, list)) and len(col) == 3:
-                            f.write(f"{btn} = {int(col[0])},{int(col[1])},{int(col[2])}\n")
-                        elif isinstance(col, dict):
-                            # write known states if provided
-                            for st in ("normal", "hover", "pressed"):
-                                if st in col and isinstance(col[st], (tuple, list)) and len(col[st]) == 3:
-                                    keyname = btn if st == "normal" else f"{btn}_{st}"
-                                    f.write(f"{keyname} = {int(col[st][0])},{int(col[st][1])},{int(col[st][2])}\n")
+                f.write("\n".join(lines) + "\n")
 
             # refresh discovery
             self.discover_themes()
@@ -1,8 +1,10 @@
 """
 UI Module - Handles the graphical user interface
 """
+import math
 import os
 import sys
+from collections import OrderedDict
 from typing import List, Optional, Tuple
 
 import pygame
@@ -46,10 +48,107 @@ THEMABLE_TEXT_BUTTONS = [
     ("Compact Track List", "compact_track_list"),
 ]
 
+# Lower-cased display label -> config key, for resolving a Button's label to
+# its [button_colors] entry without scanning the list above.
+THEMABLE_BUTTON_KEYS = {label.lower(): key for label, key in THEMABLE_TEXT_BUTTONS}
+
+# Digit typed for each number row and numeric keypad key (SDL's keypad codes
+# are not contiguous, so a table is simpler than range arithmetic)
+_DIGIT_KEYS = {
+    **{getattr(pygame, f"K_{d}"): str(d) for d in range(10)},
+    **{getattr(pygame, f"K_KP{d}"): str(d) for d in range(10)},
+}
+
+# Rendered button labels keyed by (id(font), text, color). Values keep the
+# font alongside the surface so a new font reusing a freed id() misses
+# instead of returning a stale render. Bounded FIFO.
+_TEXT_SURFACE_CACHE: "OrderedDict[tuple, Tuple[object, pygame.Surface]]" = OrderedDict()
+_TEXT_SURFACE_CACHE_MAX = 512
+
+
+def _render_text_cached(font, text: str, color) -> pygame.Surface:
+    """Render antialiased text, reusing a cached surface for repeat labels.
+
+    The returned surface is shared and must be treated as read-only.
+    """
+    key = (id(font), text, tuple(color))
+    entry = _TEXT_SURFACE_CACHE.get(key)
+    if entry is not None and entry[0] is font:
+        return entry[1]
+    surface = font.render(text, True, color)
+    _TEXT_SURFACE_CACHE[key] = (font, surface)
+    if len(_TEXT_SURFACE_CACHE) > _TEXT_SURFACE_CACHE_MAX:
+        _TEXT_SURFACE_CACHE.popitem(last=False)
+    return surface
+
+
+# Unit-circle (cos, sin) pairs for the 16 gear outline points (8 teeth, an
+# outer and an inner point each)
+_GEAR_ANGLES = tuple(
+    (math.cos(i * math.pi / 8), math.sin(i * math.pi / 8)) for i in range(16)
+)
+
+# Per-channel lookup tables for the synthesized hover (lighter) and pressed
+# (darker) button colors, so deriving them is a C-level map over the channels
+_HOVER_LUT = tuple(min(c + 50, 255) for c in range(256))
+_PRESSED_LUT = tuple(max(c - 20, 0) for c in range(256))
+
+
+def _hover_variant(color) -> Tuple[int, ...]:
+    """Return the lighter hover variant of a button color"""
+    try:
+        return tuple(map(_HOVER_LUT.__getitem__, color))
+    except (IndexError, TypeError):
+        # Out-of-range or non-int channels: compute them directly
+        return tuple(min(c + 50, 255) for c in color)
+
+
+def _pressed_variant(color) -> Tuple[int, ...]:
+    """Return the darker pressed variant of a button color"""
+    try:
+        return tuple(map(_PRESSED_LUT.__getitem__, color))
+    except (IndexError, TypeError):
+        return tuple(max(c - 20, 0) for c in color)
+
+
+def _font_backend_name(fnt) -> str:
+    """Best-effort name of the rendering backend behind a UI font object"""
+    if hasattr(fnt, '_ft'):
+        return 'freetype'
+    if hasattr(fnt, '_pf'):
+        return 'Pillow'
+    # pygame.font.Font surface-like objects usually expose get_ascent
+    if hasattr(fnt, 'get_ascent'):
+        return 'pygame.font'
+    # bundled bitmap font has get_height and no render inconsistencies
+    return fnt.__class__.__name__
+
 
 class Button:
     """Simple button class for UI controls"""
 
+    # The UI creates dozens of buttons and reads these on every frame; fixed
+    # slots keep instances small and attribute reads cheap.
+    __slots__ = (
+        "rect",
+        "text",
+        "_theme_colored",
+        "color",
+        "hover_color",
+        "pressed_color",
+        "is_hovered",
+        "theme",
+        "_cached_theme",
+        "_theme_version",
+        "_cached_text_color",
+        "is_gear_icon",
+        "icon_type",
+        "_scaled_img_cache",
+        "_face_cache",
+        "_gear_geometry",
+        "_icon_geometry",
+    )
+
     def __init__(
         self,
         x: int,
@@ -81,44 +180,138 @@ class Button:
         # If color is not explicitly provided, prefer a per-button theme color
         # (eg. CLR, ENT, Credits) if provided, otherwise fall back to the
         # theme's 'button' color or a sensible default.
+        self._theme_colored = color is None
         if color is None:
-            try:
-                if theme is not None:
-                    # Use the button label as the lookup key (case-insensitive).
-                    self_text = text or ""
-                    # Prefer a per-button color API if available, otherwise
-                    # fall back to the general theme color.
-                    if hasattr(theme, 'get_button_color'):
-                        color = theme.get_button_color(self_text, Colors.GRAY, state="normal")
-                        hover = theme.get_button_color(self_text, tuple(min(c + 50, 255) for c in color), state="hover")
-                        pressed = theme.get_button_color(self_text, tuple(max(c - 20, 0) for c in color), state="pressed")
-                        self.hover_color = hover
-                        self.pressed_color = pressed
-                    else:
-                        # Theme only exposes get_color; use the generic button key
-                        color = theme.get_color("button", Colors.GRAY)
-                        # Hover/pressed variants can be synthesized from base color
-                        self.hover_color = tuple(min(c + 50, 255) for c in color)
-                        self.pressed_color = tuple(max(c - 20, 0) for c in color)
-                else:
-                    color = Colors.GRAY
-            except Exception:
-                color = Colors.GRAY
-
-        self.color = color
-        # If hover_color wasn't set above, synthesize from base color
-        if not hasattr(self, "hover_color"):
-            self.hover_color = tuple(min(c + 50, 255) for c in color)
-        if not hasattr(self, "pressed_color"):
+            color, self.hover_color, self.pressed_color = self._theme_button_colors(
+                theme
+            )
+        else:
+            self.hover_color = _hover_variant(color)
             # pressed default is slightly darker
-            self.pressed_color = tuple(max(c - 20, 0) for c in color)
+            self.pressed_color = _pressed_variant(color)
+        self.color = color
         self.is_hovered = False
         self.theme = theme
+        # Label color and the (theme, theme._version) it was read from; draw()
+        # re-reads theme colors only when either changes.
+        self._cached_theme = theme
+        self._theme_version = getattr(theme, "_version", 0)
+        self._cached_text_color = self._theme_text_color(theme)
         self.is_gear_icon = is_gear_icon
         self.icon_type = icon_type
+        # Theme images scaled to this button's size, keyed by
+        # (id(image), size, brightened); see _scaled_image()
+        self._scaled_img_cache = {}
+        # Rendered untextured button faces keyed by (size, color, text, font,
+        # text color); see _plain_face()
+        self._face_cache = {}
+        # ((center, radius), gear outline points); see _gear_points()
+        self._gear_geometry = None
+        # ((icon_type, center, icon_size), shapes); see _media_icon_shapes()
+        self._icon_geometry = None
+
+    def _theme_button_colors(self, theme) -> Tuple[tuple, tuple, tuple]:
+        """Return (normal, hover, pressed) colors for this button from `theme`"""
+        try:
+            if theme is None:
+                color = Colors.GRAY
+            elif hasattr(theme, 'get_button_color'):
+                # Use the button label as the lookup key (case-insensitive),
+                # mapping themable labels to their theme.conf key.
+                self_text = self.text or ""
+                self_text = THEMABLE_BUTTON_KEYS.get(
+                    self_text.strip().lower(), self_text
+                )
+                # Prefer a per-button color API if available
+                color = theme.get_button_color(self_text, Colors.GRAY, state="normal")
+                hover = theme.get_button_color(self_text, _hover_variant(color), state="hover")
+                pressed = theme.get_button_color(self_text, _pressed_variant(color), state="pressed")
+                return color, hover, pressed
+            else:
+                # Theme only exposes get_color; use the generic button key
+                color = theme.get_color("button", Colors.GRAY)
+        except Exception:
+            color = Colors.GRAY
+        # Hover/pressed variants can be synthesized from base color
+        return color, _hover_variant(color), _pressed_variant(color)
+
+    @staticmethod
+    def _theme_text_color(theme) -> Tuple[int, int, int]:
+        """Return the label color for text buttons drawn with `theme`"""
+        if not theme:
+            return Colors.WHITE
+        # theme.get_color may not exist on lightweight stubs used in tests
+        try:
+            return theme.get_color("button_text", Colors.WHITE)
+        except Exception:
+            # fallback to colors dict or default
+            try:
+                return getattr(theme, 'colors', {}).get('button_text', Colors.WHITE)
+            except Exception:
+                return Colors.WHITE
+
+    def _refresh_theme(self) -> None:
+        """Re-read theme colors after the theme was swapped or changed"""
+        theme = self.theme
+        if self._theme_colored:
+            self.color, self.hover_color, self.pressed_color = (
+                self._theme_button_colors(theme)
+            )
+        self._cached_text_color = self._theme_text_color(theme)
+        self._scaled_img_cache.clear()
+        self._face_cache.clear()
+        self._cached_theme = theme
+        self._theme_version = getattr(theme, "_version", 0)
+
+    # Scaled variants kept per button before the cache is reset (covers the
+    # normal/hover/pressed images across a resize or two)
+    _SCALED_IMG_CACHE_MAX = 8
+
+    def _scaled_image(
+        self, img: pygame.Surface, brighten: bool = False
+    ) -> pygame.Surface:
+        """Return `img` scaled to the button rect, reusing earlier results.
+
+        The rect is moved/resized in place by the layout code, so its size is
+        part of the key; the source image is stored with the result so a new
+        image reusing a freed id() does not hit a stale entry.
+        """
+        size = self.rect.size
+        key = (id(img), size, brighten)
+        entry = self._scaled_img_cache.get(key)
+        if entry is not None and entry[0] is img:
+            return entry[1]
+
+        if img.get_size() != size:
+            scaled = pygame.transform.scale(img, size)
+        else:
+            scaled = img
+        if brighten:
+            scaled = self.apply_brightness_filter(scaled, 1.3)
+
+        if len(self._scaled_img_cache) >= self._SCALED_IMG_CACHE_MAX:
+            self._scaled_img_cache.clear()
+        self._scaled_img_cache[key] = (img, scaled)
+        return scaled
+
+    def draw(
+        self, surface: pygame.Surface, font: pygame.font.Font, labels: list = None
+    ) -> None:
+        """Draw the button on the surface
 
-    def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
-        """Draw the button on the surface"""
+        If `labels` is given, a text button's label is appended to it as a
+        (surface, rect) pair instead of being blitted, so a caller drawing a
+        group of non-overlapping buttons can blit all labels in one blits().
+        """
+        rect = self.rect
+        if rect.width and rect.height and not surface.get_clip().colliderect(rect):
+            # Entirely outside the drawable area; skip image/text setup
+            return
+        theme = self.theme
+        if theme is not self._cached_theme or (
+            theme is not None and getattr(theme, "_version", 0) != self._theme_version
+        ):
+            self._refresh_theme()
         # Draw button visuals depending on theme availability and button type.
         state = "hover" if self.is_hovered else "normal"
 
@@ -132,12 +325,7 @@ class Button:
                     img = self.theme.get_media_button_image(self.icon_type, state=state)
 
                 if img is not None:
-                    # Only scale if the image size doesn't match the button size
-                    if img.get_width() != self.rect.width or img.get_height() != self.rect.height:
-                        scaled_img = pygame.transform.scale(img, (self.rect.width, self.rect.height))
-                    else:
-                        scaled_img = img
-                    surface.blit(scaled_img, self.rect)
+                    surface.blit(self._scaled_image(img), self.rect)
                 else:
                     # Fallback to normal-state image if available
                     if self.is_gear_icon:
@@ -146,13 +334,9 @@ class Button:
                         base_img = self.theme.get_media_button_image(self.icon_type, state="normal")
 
                     if base_img is not None:
-                        # Only scale if the image size doesn't match the button size
-                        if base_img.get_width() != self.rect.width or base_img.get_height() != self.rect.height:
-                            scaled_img = pygame.transform.scale(base_img, (self.rect.width, self.rect.height))
-                        else:
-                            scaled_img = base_img
-                        if self.is_hovered and not self.is_gear_icon:
-                            scaled_img = self.apply_brightness_filter(scaled_img, 1.3)
+                        scaled_img = self._scaled_image(
+                            base_img, self.is_hovered and not self.is_gear_icon
+                        )
                         surface.blit(scaled_img, self.rect)
                     else:
                         # No themed asset: draw the default icon/gear
@@ -182,55 +366,73 @@ class Button:
                     button_img = self.theme.get_button_image(state)
             else:
                 button_img = self.theme.get_button_image(state)
-            if button_img is not None:
-                scaled_img = pygame.transform.scale(button_img, (self.rect.width, self.rect.height))
-                surface.blit(scaled_img, self.rect)
-            else:
-                color = self.hover_color if self.is_hovered else self.color
-                pygame.draw.rect(surface, color, self.rect)
-                pygame.draw.rect(surface, Colors.WHITE, self.rect, 2)
+        else:
+            button_img = None
+        if button_img is not None:
+            surface.blit(self._scaled_image(button_img), self.rect)
         else:
             color = self.hover_color if self.is_hovered else self.color
+            face = self._plain_face(surface, font, color)
+            if face is not None:
+                # Background, border and label in one opaque blit
+                surface.blit(face, rect)
+                return
             pygame.draw.rect(surface, color, self.rect)
             pygame.draw.rect(surface, Colors.WHITE, self.rect, 2)
 
         # Now draw the text label on top for text-based buttons
-        if self.theme:
-            # theme.get_color may not exist on lightweight stubs used in tests
-            try:
-                text_color = self.theme.get_color("button_text", Colors.WHITE)
-            except Exception:
-                # fallback to colors dict or default
-                try:
-                    text_color = getattr(self.theme, 'colors', {}).get('button_text', Colors.WHITE)
-                except Exception:
-                    text_color = Colors.WHITE
-        else:
-            text_color = Colors.WHITE
-        text_surface = font.render(self.text, True, text_color)
+        text_surface = _render_text_cached(font, self.text, self._cached_text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        if labels is not None:
+            labels.append((text_surface, text_rect))
+        else:
+            surface.blit(text_surface, text_rect)
+
+    # Pre-rendered plain faces kept per button (normal and hover, across a
+    # resize or a font change) before the cache is reset
+    _FACE_CACHE_MAX = 4
+
+    def _plain_face(
+        self, surface: pygame.Surface, font: pygame.font.Font, color: tuple
+    ) -> Optional[pygame.Surface]:
+        """Return this text button rendered without a theme image.
+
+        The filled rect, white border and label are drawn once into an opaque
+        surface matching `surface`'s format and reused while the size, colors,
+        text and font stay the same. Returns None when the label overflows the
+        button (a face surface would clip it), or when `surface` has per-pixel
+        alpha.
+        """
+        if surface.get_flags() & pygame.SRCALPHA:
+            return None
+        size = self.rect.size
+        key = (size, color, self.text, font, self._cached_text_color)
+        face = self._face_cache.get(key)
+        if face is not None:
+            return face
+
+        text_surface = _render_text_cached(font, self.text, self._cached_text_color)
+        local = pygame.Rect((0, 0), size)
+        text_rect = text_surface.get_rect(center=local.center)
+        if not local.contains(text_rect):
+            return None
+        face = pygame.Surface(size, 0, surface)
+        pygame.draw.rect(face, color, local)
+        pygame.draw.rect(face, Colors.WHITE, local, 2)
+        face.blit(text_surface, text_rect)
+
+        if len(self._face_cache) >= self._FACE_CACHE_MAX:
+            self._face_cache.clear()
+        self._face_cache[key] = face
+        return face
 
     def draw_gear_icon(self, surface: pygame.Surface) -> None:
         """Draw a gear icon in the button center"""
         center_x, center_y = self.rect.center
         radius = min(self.rect.width, self.rect.height) // 3
 
-        # Draw outer gear teeth (8 teeth)
-        import math
-
-        teeth_points = []
-        for i in range(16):  # 8 teeth, 2 points each
-            angle = i * math.pi / 8
-            if i % 2 == 0:
-                # Outer tooth point
-                tooth_radius = radius + 4
-            else:
-                # Inner tooth point
-                tooth_radius = radius
-            x = center_x + tooth_radius * math.cos(angle)
-            y = center_y + tooth_radius * math.sin(angle)
-            teeth_points.append((x, y))
+        # Outer gear teeth (8 teeth), only recomputed when the rect changes
+        teeth_points = self._gear_points((center_x, center_y), radius)
 
         # Use different colors for hover effect
         if self.is_hovered:
@@ -249,6 +451,23 @@ class Button:
         pygame.draw.circle(surface, inner_color, (center_x, center_y), inner_radius)
         pygame.draw.circle(surface, gear_color, (center_x, center_y), inner_radius, 2)
 
+    def _gear_points(
+        self, center: Tuple[int, int], radius: int
+    ) -> List[Tuple[float, float]]:
+        """Return the gear outline polygon for the given center and radius"""
+        key = (center, radius)
+        if self._gear_geometry is None or self._gear_geometry[0] != key:
+            center_x, center_y = center
+            points = []
+            for i, (cos_a, sin_a) in enumerate(_GEAR_ANGLES):
+                # Even points are outer tooth tips, odd ones the tooth roots
+                tooth_radius = radius + 4 if i % 2 == 0 else radius
+                points.append(
+                    (center_x + tooth_radius * cos_a, center_y + tooth_radius * sin_a)
+                )
+            self._gear_geometry = (key, points)
+        return self._gear_geometry[1]
+
     def draw_media_icon(self, surface: pygame.Surface) -> None:
         """Draw play, pause, or stop icon based on icon_type"""
         center_x, center_y = self.rect.center
@@ -261,59 +480,80 @@ class Button:
 
         color = Colors.WHITE if self.is_hovered else Colors.LIGHT_GRAY
 
+        shapes = self._media_icon_shapes((center_x, center_y), icon_size)
         if self.icon_type == "play":
-            # Draw play triangle (pointing right)
-            triangle_points = [
-                (center_x - icon_size // 2, center_y - icon_size // 2),
-                (center_x - icon_size // 2, center_y + icon_size // 2),
-                (center_x + icon_size // 2, center_y),
-            ]
-            pygame.draw.polygon(surface, color, triangle_points)
+            # Play triangle (pointing right)
+            pygame.draw.polygon(surface, color, shapes)
 
         elif self.icon_type == "pause":
-            # Draw pause (two vertical bars)
-            bar_width = icon_size // 4
-            bar_height = icon_size
-            left_bar = pygame.Rect(
-                center_x - icon_size // 3,
-                center_y - bar_height // 2,
-                bar_width,
-                bar_height,
-            )
-            right_bar = pygame.Rect(
-                center_x + icon_size // 6,
-                center_y - bar_height // 2,
-                bar_width,
-                bar_height,
-            )
+            # Pause (two vertical bars)
+            left_bar, right_bar = shapes
             pygame.draw.rect(surface, color, left_bar)
             pygame.draw.rect(surface, color, right_bar)
 
         elif self.icon_type == "stop":
-            # Draw stop (square)
-            stop_rect = pygame.Rect(
-                center_x - icon_size // 2,
-                center_y - icon_size // 2,
-                icon_size,
-                icon_size,
-            )
-            pygame.draw.rect(surface, color, stop_rect)
+            # Stop (square)
+            pygame.draw.rect(surface, color, shapes)
 
         elif self.icon_type == "exit":
-            # Draw a simple 'X' exit symbol centered inside the button
-            thickness = max(2, icon_size // 3)
-            # Coordinates for X lines
-            x1, y1 = center_x - icon_size // 2, center_y - icon_size // 2
-            x2, y2 = center_x + icon_size // 2, center_y + icon_size // 2
-            x3, y3 = center_x - icon_size // 2, center_y + icon_size // 2
-            x4, y4 = center_x + icon_size // 2, center_y - icon_size // 2
-            pygame.draw.line(surface, color, (x1, y1), (x2, y2), thickness)
-            pygame.draw.line(surface, color, (x3, y3), (x4, y4), thickness)
+            # A simple 'X' exit symbol centered inside the button
+            first, second, thickness = shapes
+            pygame.draw.line(surface, color, first[0], first[1], thickness)
+            pygame.draw.line(surface, color, second[0], second[1], thickness)
 
         else:
-            # Fallback: draw a simple centered dot so the button isn't empty
-            dot_radius = max(2, icon_size // 4)
-            pygame.draw.circle(surface, color, (center_x, center_y), dot_radius)
+            # Fallback: a simple centered dot so the button isn't empty
+            pygame.draw.circle(surface, color, (center_x, center_y), shapes)
+
+    def _media_icon_shapes(self, center: Tuple[int, int], icon_size: int):
+        """Return the drawing primitives for this button's default media icon.
+
+        Only recomputed when the icon type, button center or icon size
+        changes; the layout code moves button rects in place every frame.
+        """
+        key = (self.icon_type, center, icon_size)
+        if self._icon_geometry is not None and self._icon_geometry[0] == key:
+            return self._icon_geometry[1]
+
+        center_x, center_y = center
+        half = icon_size // 2
+        if self.icon_type == "play":
+            shapes = [
+                (center_x - half, center_y - half),
+                (center_x - half, center_y + half),
+                (center_x + half, center_y),
+            ]
+        elif self.icon_type == "pause":
+            bar_width = icon_size // 4
+            bar_height = icon_size
+            shapes = (
+                pygame.Rect(
+                    center_x - icon_size // 3,
+                    center_y - bar_height // 2,
+                    bar_width,
+                    bar_height,
+                ),
+                pygame.Rect(
+                    center_x + icon_size // 6,
+                    center_y - bar_height // 2,
+                    bar_width,
+                    bar_height,
+                ),
+            )
+        elif self.icon_type == "stop":
+            shapes = pygame.Rect(center_x - half, center_y - half, icon_size, icon_size)
+        elif self.icon_type == "exit":
+            shapes = (
+                ((center_x - half, center_y - half), (center_x + half, center_y + half)),
+                ((center_x - half, center_y + half), (center_x + half, center_y - half)),
+                max(2, icon_size // 3),
+            )
+        else:
+            # Dot radius for the fallback icon
+            shapes = max(2, icon_size // 4)
+
+        self._icon_geometry = (key, shapes)
+        return shapes
 
     def update(self, pos: Tuple[int, int]) -> None:
         """Update button hover state"""
@@ -354,6 +594,8 @@ class Button:
 class NumberPadButton(Button):
     """Number pad button with digit value"""
 
+    __slots__ = ("digit",)
+
     def __init__(self, x: int, y: int, width: int, height: int, digit: str, theme=None):
         """
         Initialize a number pad button
@@ -410,7 +652,7 @@ class UI:
         # StubTheme objects that don't implement `get_color`. Be defensive
         # and fallback to the provided default colors if the method isn't
         # present to avoid AttributeError in headless tests.
-        def _theme_color(key, default):
+        def _lookup_theme_color(key, default):
             if hasattr(self.current_theme, "get_color") and callable(
                 getattr(self.current_theme, "get_color")
             ):
@@ -426,6 +668,28 @@ class UI:
                 pass
             return default
 
+        # Resolved colors keyed by (key, default), valid for the theme object
+        # and theme _version in _theme_color_stamp. Themes without a _version
+        # counter are looked up on every call.
+        theme_color_cache = {}
+        self._theme_color_stamp = None
+
+        def _theme_color(key, default):
+            theme = self.current_theme
+            version = getattr(theme, "_version", None)
+            if version is None:
+                return _lookup_theme_color(key, default)
+            stamp = self._theme_color_stamp
+            if stamp is None or stamp[0] is not theme or stamp[1] != version:
+                theme_color_cache.clear()
+                self._theme_color_stamp = (theme, version)
+            cache_key = (key, default)
+            try:
+                return theme_color_cache[cache_key]
+            except KeyError:
+                color = theme_color_cache[cache_key] = _lookup_theme_color(key, default)
+                return color
+
         self.text_color = lambda: _theme_color("text", Colors.WHITE)
         self.text_secondary_color = lambda: _theme_color("text_secondary", Colors.LIGHT_GRAY)
         self.accent_color = lambda: _theme_color("accent", Colors.GREEN)
@@ -443,13 +707,16 @@ class UI:
         if self.fullscreen:
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
             # Get actual fullscreen dimensions
-            self.width = self.screen.get_width()
-            self.height = self.screen.get_height()
+            self.width, self.height = self.screen.get_size()
         else:
             self.screen = pygame.display.set_mode(
                 (self.width, self.height), pygame.RESIZABLE
             )
         pygame.display.set_caption("JukeBox - Album Library")
+        # Theme images decoded before the display existed (eg. by the startup
+        # preload) can only be converted to its pixel format now.
+        if hasattr(self.theme_manager, "convert_current_theme"):
+            self.theme_manager.convert_current_theme()
         self.clock = pygame.time.Clock()
         self.running = True
         self.fps = 60
@@ -482,37 +749,10 @@ class UI:
         self.medium_font = font_dict['medium_font']
         self.small_medium_font = font_dict['small_medium_font']
         self.small_font = font_dict['small_font']
-        # Create a slightly larger credits font (small_font size + 5px) so
-        # the credits counter stands out. Fall back gracefully if font
-        # construction fails in test environments.
-        try:
-            # Prefer pygame.font.SysFont (works in most test envs)
-            desired_h = max(8, int(self.small_font.get_height()) + 5)
-            try:
-                self.credits_font = pygame.font.SysFont(None, desired_h)
-            except Exception:
-                # If SysFont isn't available, use medium_font as a fallback
-                self.credits_font = self.medium_font
-        except Exception:
-            self.credits_font = self.small_font
-        # Add a dedicated font for the 4-digit album/track selection display
-        # The user requested a DS-DIGIT.TTF at 72pt for that display. Load it
-        # if present and fall back gracefully to a large system font.
-        try:
-            sel_font_path = os.path.join(os.path.dirname(__file__), '..', 'assets', 'fonts', 'DS-DIGIT.TTF')
-            sel_font_path = os.path.normpath(sel_font_path)
-            if os.path.exists(sel_font_path):
-                try:
-                    self.selection_digits_font = pygame.font.Font(sel_font_path, 72)
-                except Exception:
-                    self.selection_digits_font = pygame.font.SysFont(None, 72)
-            else:
-                try:
-                    self.selection_digits_font = pygame.font.SysFont(None, 72)
-                except Exception:
-                    self.selection_digits_font = self.large_font
-        except Exception:
-            self.selection_digits_font = self.large_font
+        # Slightly larger credits counter font and the DS-DIGIT font for the
+        # 4-digit selection display (both with fallbacks in FontManager)
+        self.credits_font = font_dict['credits_font']
+        self.selection_digits_font = font_dict['selection_digits_font']
         self.tiny_font = font_dict['tiny_font']
         self.track_list_font = font_dict['track_list_font']
         self.track_list_font_fullscreen = font_dict['track_list_font_fullscreen']
@@ -521,6 +761,10 @@ class UI:
         # Performance optimizations
         self._cached_background = None
         self._last_bg_size = (0, 0)
+        # Background with static main-screen chrome, and the (background,
+        # screen size, theme version, colors, fonts, layout) it was drawn from
+        self._main_chrome = None
+        self._main_chrome_key = None
         self._text_cache = {}
         self._text_cache_size = 0
         self._max_cache_size = 100
@@ -604,22 +848,31 @@ class UI:
         # Create buttons
         self.setup_buttons()
 
-        # Helpful startup diagnostics for font backend & metrics — this
-        # makes it easier to troubleshoot display problems like clipped
-        # or half-rendered characters. The output is intentionally
-        # concise so it can be read in logs when running the app.
+        # Startup diagnostics for font backend & metrics — this makes it
+        # easier to troubleshoot display problems like clipped or
+        # half-rendered characters. They probe-render every font, so like
+        # the on-screen overlay they only run when font debugging is on
+        # (config 'debug_font_overlay' or JBOX_DEBUG_FONT=1).
         try:
-            def _detect_backend(fnt):
-                if hasattr(fnt, '_ft'):
-                    return 'freetype'
-                if hasattr(fnt, '_pf'):
-                    return 'Pillow'
-                # pygame.font.Font surface-like objects usually expose get_ascent
-                if hasattr(fnt, 'get_ascent'):
-                    return 'pygame.font'
-                # bundled bitmap font has get_height and no render inconsistencies
-                return fnt.__class__.__name__
+            font_debug = bool(self.config.get("debug_font_overlay", False)) or os.getenv(
+                "JBOX_DEBUG_FONT"
+            )
+        except Exception:
+            font_debug = bool(os.getenv("JBOX_DEBUG_FONT"))
+        if font_debug:
+            self._print_font_diagnostics()
 
+        # Theme creator state (modal)
+        self.theme_creator_open = False
+        self.theme_creator_name = ""
+        self.theme_creator_button_colors = {}
+        self.theme_creator_selected_button = None
+        self.theme_creator_selected_state = "normal"
+        self.theme_creator_sliders = None
+
+    def _print_font_diagnostics(self) -> None:
+        """Print each UI font's backend, reported height and rendered height"""
+        try:
             info = []
             for name in ('small_font', 'medium_font', 'large_font', 'tiny_font'):
                 f = getattr(self, name, None)
@@ -634,19 +887,11 @@ class UI:
                     sh = surf.get_height()
                 except Exception:
                     sh = 'ERR'
-                info.append(f"{name}:{_detect_backend(f)} get_height={gh} surf_h={sh}")
+                info.append(f"{name}:{_font_backend_name(f)} get_height={gh} surf_h={sh}")
             print("Font diagnostics: ", ", ".join(info))
         except Exception:
             pass
 
-        # Theme creator state (modal)
-        self.theme_creator_open = False
-        self.theme_creator_name = ""
-        self.theme_creator_button_colors = {}
-        self.theme_creator_selected_button = None
-        self.theme_creator_selected_state = "normal"
-        self.theme_creator_sliders = None
-
     def _player_safe_call(self, method_name: str, *args, **kwargs):
         """Safely call player methods, handling None player"""
         if self.player is None:
@@ -1083,32 +1328,8 @@ class UI:
             event: pygame key event
         """
         # Convert key event to digit
-        key_map = {
-            pygame.K_0: "0",
-            pygame.K_1: "1",
-            pygame.K_2: "2",
-            pygame.K_3: "3",
-            pygame.K_4: "4",
-            pygame.K_5: "5",
-            pygame.K_6: "6",
-            pygame.K_7: "7",
-            pygame.K_8: "8",
-            pygame.K_9: "9",
-            # also accept numeric keypad keys
-            pygame.K_KP0: "0",
-            pygame.K_KP1: "1",
-            pygame.K_KP2: "2",
-            pygame.K_KP3: "3",
-            pygame.K_KP4: "4",
-            pygame.K_KP5: "5",
-            pygame.K_KP6: "6",
-            pygame.K_KP7: "7",
-            pygame.K_KP8: "8",
-            pygame.K_KP9: "9",
-        }
-
-        if event.key in key_map:
-            digit = key_map[event.key]
+        digit = _DIGIT_KEYS.get(event.key)
+        if digit is not None:
             self.selection_buffer += digit
             self.selection_mode = True
 
@@ -1199,19 +1420,15 @@ class UI:
                             (self.width, self.height), pygame.RESIZABLE
                         )
 
-                # Invalidate cached background on resize
-                self._cached_background = None
-                self._needs_full_redraw = True
                 # Invalidate cached background on resize
                 self._cached_background = None
                 self._needs_full_redraw = True
                 # Navigation button positions are now handled in draw_number_pad_centered()
 
             elif event.type == pygame.MOUSEMOTION:
-                # If an exit confirmation modal is open, handle its clicks first
-                if getattr(self, "exit_confirm_open", False):
-                    # Only update hover states on motion; clicks are handled in MOUSEBUTTONDOWN
-                    # Only update hover states on motion; clicks are handled in MOUSEBUTTONDOWN
+                # While the exit confirmation modal is open, only update its
+                # hover states; clicks are handled in MOUSEBUTTONUP
+                if self.exit_confirm_open:
                     try:
                         self.exit_confirm_yes.update(event.pos)
                         self.exit_confirm_no.update(event.pos)
@@ -1219,35 +1436,13 @@ class UI:
                         pass
                     continue
 
-                # If an exit confirmation modal is open, handle its clicks first
-                if getattr(self, "exit_confirm_open", False):
-                    if self.exit_confirm_yes.is_clicked(getattr(event, 'pos', None)):
-                        self.running = False
-                        self.exit_confirm_open = False
-                        continue
-                    elif self.exit_confirm_no.is_clicked(getattr(event, 'pos', None)):
-                        self.exit_confirm_open = False
-                        continue
-
-                # If exit modal open, handle yes/no first
-                if getattr(self, "exit_confirm_open", False):
-                    if self.exit_confirm_yes.is_clicked(event.pos):
-                        self.running = False
-                        self.exit_confirm_open = False
-                        continue
-                    elif self.exit_confirm_no.is_clicked(event.pos):
-                        self.exit_confirm_open = False
-                        continue
-
-                # If exit confirmation modal is open, handle yes/no first
-                if getattr(self, "exit_confirm_open", False):
-                    if self.exit_confirm_yes.is_clicked(event.pos):
-                        self.running = False
-                        self.exit_confirm_open = False
-                        continue
-                    elif self.exit_confirm_no.is_clicked(event.pos):
-                        self.exit_confirm_open = False
-                        continue
+                # Left button state for slider hover/drag updates below, read
+                # once per motion event
+                try:
+                    mouse_pressed = pygame.mouse.get_pressed()[0]
+                except Exception:
+                    # In tests, pygame mouse may not be available
+                    mouse_pressed = False
 
                 if self.config_screen_open:
                     # If the in-app music-directory modal is open, handle modal clicks first
@@ -1308,78 +1503,6 @@ class UI:
                                 # ignore other click areas
                                 continue
 
-                        # If browser is open, allow clicks inside the large preview area as selection/open actions
-                        if self.config_browser_open:
-                            pa2 = rects["preview_area"]
-                            if pa2.collidepoint(event.pos):
-                                x, y = event.pos
-                                header_h = self.small_font.get_height()
-                                row_h = max(self.small_font.get_height(), 18)
-                                rel_y = y - (pa2.y + header_h + 8)
-                                if rel_y >= 0:
-                                    idx = self.config_browser_scroll + (rel_y // row_h)
-                                    if 0 <= idx < len(self.config_browser_entries):
-                                        self.config_browser_selected = int(idx)
-                                        ent = self.config_browser_entries[
-                                            self.config_browser_selected
-                                        ]
-                                        full = os.path.join(
-                                            self.config_browser_path, ent["name"]
-                                        )
-                                        self.config_music_input = full
-                                        # double-click detection
-                                        now = pygame.time.get_ticks()
-                                        last_idx = self._browser_last_click_idx
-                                        last_time = self._browser_last_click_time
-                                        self._browser_last_click_idx = int(
-                                            self.config_browser_selected
-                                        )
-                                        self._browser_last_click_time = now
-                                        if (
-                                            last_idx == self.config_browser_selected
-                                            and (now - last_time)
-                                            <= self._double_click_threshold_ms
-                                        ):
-                                            if ent["is_dir"]:
-                                                self._open_browser(full)
-                                continue
-
-                        # If the browser is open, handle clicks inside the preview area (selection/open)
-                        if self.config_browser_open:
-                            pa2 = rects["preview_area"]
-                            if pa2.collidepoint(event.pos):
-                                x, y = event.pos
-                                header_h = self.small_font.get_height()
-                                row_h = max(self.small_font.get_height(), 18)
-                                rel_y = y - (pa2.y + header_h + 8)
-                                if rel_y >= 0:
-                                    idx = self.config_browser_scroll + (rel_y // row_h)
-                                    if 0 <= idx < len(self.config_browser_entries):
-                                        self.config_browser_selected = int(idx)
-                                        ent = self.config_browser_entries[
-                                            self.config_browser_selected
-                                        ]
-                                        full = os.path.join(
-                                            self.config_browser_path, ent["name"]
-                                        )
-                                        self.config_music_input = full
-                                        # double-click detection
-                                        now = pygame.time.get_ticks()
-                                        last_idx = self._browser_last_click_idx
-                                        last_time = self._browser_last_click_time
-                                        self._browser_last_click_idx = int(
-                                            self.config_browser_selected
-                                        )
-                                        self._browser_last_click_time = now
-                                        if (
-                                            last_idx == self.config_browser_selected
-                                            and (now - last_time)
-                                            <= self._double_click_threshold_ms
-                                        ):
-                                            if ent["is_dir"]:
-                                                self._open_browser(full)
-                                continue
-
                         # do not process other config clicks while modal open
                         continue
                     self.config_rescan_button.update(event.pos)
@@ -1388,13 +1511,8 @@ class UI:
                     self.config_extract_art_button.update(event.pos)
                     self.config_compact_button.update(event.pos)
                     # Update density slider hover/drag state
-                    try:
-                        mouse_pressed = pygame.mouse.get_pressed()[0]
-                        self.config_density_slider.update(event.pos, mouse_pressed)
-                        self.config_auto_scroll_speed_slider.update(event.pos, mouse_pressed)
-                    except Exception:
-                        # In tests, pygame mouse may not be available - ignore
-                        pass
+                    self.config_density_slider.update(event.pos, mouse_pressed)
+                    self.config_auto_scroll_speed_slider.update(event.pos, mouse_pressed)
                     self.config_equalizer_button.update(event.pos)
                     self.config_fullscreen_button.update(event.pos)
                     self.config_choose_music_button.update(event.pos)
@@ -1404,19 +1522,10 @@ class UI:
                     # Update the 'New Theme' button if present
                     if hasattr(self, "new_theme_button"):
                         self.new_theme_button.update(event.pos)
-                    # Update theme creator sliders if present (hover/drag state)
-                    if getattr(self, "theme_creator_open", False) and self.theme_creator_sliders:
-                        try:
-                            mouse_pressed = pygame.mouse.get_pressed()[0]
-                            for s in self.theme_creator_sliders:
-                                s.update(event.pos, mouse_pressed)
-                        except Exception:
-                            pass
                 # If theme creator modal is open globally (any screen), handle
                 # slider hover/drag updates here and consume the motion event.
                 if getattr(self, "theme_creator_open", False) and self.theme_creator_sliders:
                     try:
-                        mouse_pressed = pygame.mouse.get_pressed()[0]
                         for s in self.theme_creator_sliders:
                             s.update(event.pos, mouse_pressed)
                     except Exception:
@@ -1424,7 +1533,6 @@ class UI:
                     continue
 
                 elif self.screen_mode == "equalizer":
-                    mouse_pressed = pygame.mouse.get_pressed()[0]
                     for slider in self.eq_sliders:
                         slider.update(event.pos, mouse_pressed)
                     self.eq_back_button.update(event.pos)
@@ -1432,7 +1540,6 @@ class UI:
                     for _, btn in self.eq_preset_buttons:
                         btn.update(event.pos)
                 elif self.screen_mode == "fader":
-                    mouse_pressed = pygame.mouse.get_pressed()[0]
                     self.fader_target_slider.update(event.pos, mouse_pressed)
                     self.fader_speed_slider.update(event.pos, mouse_pressed)
                     self.fader_back_button.update(event.pos)
@@ -1451,7 +1558,6 @@ class UI:
                     # Credit button (main screen)
                     if hasattr(self, "credit_button"):
                         self.credit_button.update(event.pos)
-                    mouse_pressed = pygame.mouse.get_pressed()[0]
                     self.volume_slider.update(event.pos, mouse_pressed)
                     if self.show_equalizer:
                         for slider in self.eq_sliders:
@@ -1494,8 +1600,7 @@ class UI:
 
             elif event.type == pygame.MOUSEBUTTONUP:
                 # Also treat mouse up events for the exit confirmation modal (helps some environments)
-                if getattr(self, "exit_confirm_open", False):
-                    pass
+                if self.exit_confirm_open:
                     if self.exit_confirm_yes.is_clicked(getattr(event, 'pos', None)):
                         self.running = False
                         self.exit_confirm_open = False
@@ -1948,7 +2053,7 @@ class UI:
 
             elif event.type == pygame.KEYDOWN:
                 # If exit confirm modal is open, handle keyboard shortcuts first
-                if getattr(self, "exit_confirm_open", False):
+                if self.exit_confirm_open:
                     # Enter (or keypad Enter) -> confirm exit
                     if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                         self.running = False
@@ -2546,7 +2651,11 @@ class UI:
         """Get cached background or create new one"""
         current_size = (self.width, self.height)
         if self._cached_background is None or self._last_bg_size != current_size:
-            background = self.current_theme.get_background(self.width, self.height)
+            if hasattr(self.current_theme, "get_background_scaled"):
+                # The theme scales (and keeps) a copy at the window size
+                background = self.current_theme.get_background_scaled(current_size)
+            else:
+                background = self.current_theme.get_background(self.width, self.height)
             if background:
                 if background.get_size() == current_size:
                     self._cached_background = background
@@ -2560,9 +2669,57 @@ class UI:
             self._last_bg_size = current_size
         return self._cached_background
 
+    def get_main_screen_chrome(self) -> pygame.Surface:
+        """Get the main screen's static layer: the background with the header
+        band, title and volume panel already drawn on it"""
+        background = self.get_cached_background()
+        key = (
+            background,
+            self.screen.get_size(),
+            getattr(self.current_theme, "_version", 0),
+            self.text_color(),
+            self.large_font,
+            self.small_font,
+            self.header_height,
+            self.margin,
+        )
+        if self._main_chrome is not None and self._main_chrome_key == key:
+            return self._main_chrome
+
+        chrome = background.copy()
+        # Draw title at top header area with overlay
+        text_y = self.header_height // 2 + 2
+        self.draw_top_text_overlay(text_y, surface=chrome)
+        title = self.get_cached_text("JukeBox", self.large_font, self.text_color())
+        title_rect = title.get_rect(center=(self.width // 2, text_y))
+        chrome.blit(title, title_rect)
+
+        # Volume label, then a semi-transparent black box (50% opacity)
+        # behind the label and slider to improve contrast against busy
+        # backgrounds. Geometry matches the slider placed in
+        # draw_main_screen().
+        controls_margin_top = self.header_height + 20
+        volume_label = self.small_font.render("Volume", True, self.text_color())
+        chrome.blit(volume_label, (self.margin, controls_margin_top + 2))
+        slider_y = controls_margin_top + 25
+        slider_w, slider_h = 220, 20
+        label_h = self.small_font.get_height()
+        # Top padding: include previous 6px + label height + 6px spacing
+        top_extra = label_h + 12
+        # Extend downward by 10px to give the slider more breathing room
+        vol_overlay_h = slider_h + 12 + top_extra + 10
+        vol_overlay_surf = pygame.Surface((slider_w + 20, vol_overlay_h), pygame.SRCALPHA)
+        vol_overlay_surf.fill((0, 0, 0, int(255 * 0.5)))
+        chrome.blit(vol_overlay_surf, (self.margin - 8, slider_y - top_extra))
+
+        self._main_chrome = chrome
+        self._main_chrome_key = key
+        return chrome
+
     def clear_caches(self) -> None:
         """Clear caches when needed (theme changes, etc.)"""
         self._cached_background = None
+        self._main_chrome = None
         self._text_cache.clear()
         self._text_cache_size = 0
         self._needs_full_redraw = True
@@ -3394,9 +3551,9 @@ class UI:
 
     def draw_main_screen(self) -> None:
         """Draw the main playbook screen with 3-column 2-row layout"""
-        # Always use cached background for consistent rendering
-        background = self.get_cached_background()
-        self.screen.blit(background, (0, 0))
+        # Background plus the static header band, title and volume panel,
+        # rebuilt only when the window, theme or fonts change
+        self.screen.blit(self.get_main_screen_chrome(), (0, 0))
 
         # Track changes for potential future optimizations
         current_volume = self.player.get_volume()
@@ -3408,13 +3565,6 @@ class UI:
         self._last_volume = current_volume
         self._last_track_info = current_track
 
-        # Draw title at top header area with overlay
-        text_y = self.header_height // 2 + 2
-        self.draw_top_text_overlay(text_y)
-        title = self.get_cached_text("JukeBox", self.large_font, self.text_color())
-        title_rect = title.get_rect(center=(self.width // 2, text_y))
-        self.screen.blit(title, title_rect)
-
         # Auto-scroll update will happen later in the frame (after we
         # compute album card rects) so we can correctly compute visible
         # tracks per-card. We set a transient attribute here which will
@@ -3429,33 +3579,11 @@ class UI:
         button_height = 50  # Match square button size
         media_button_size = 50  # Square buttons
         spacing = 12
-        # Volume slider positioning
-        volume_label = self.small_font.render("Volume", True, self.text_color())
-        self.screen.blit(volume_label, (self.margin, controls_margin_top + 2))
-
+        # Volume slider positioning (label and backing box are in the chrome)
         self.volume_slider.x = self.margin
         self.volume_slider.y = controls_margin_top + 25  # Adjusted for increased margin
         self.volume_slider.width = 220
         self.volume_slider.height = 20
-        # Draw a semi-transparent black box behind the volume slider to
-        # improve contrast (50% opacity). This sits behind the slider and
-        # does not affect interaction with the slider itself.
-        try:
-            # Include the volume label above the slider in the overlay so the
-            # label and slider are visible against busy backgrounds.
-            label_h = self.small_font.get_height()
-            vol_overlay_w = self.volume_slider.width + 20
-            # Top padding: include previous 6px + label height + 6px spacing
-            top_extra = label_h + 12
-            # Extend downward by 10px to give the slider more breathing room
-            vol_overlay_h = self.volume_slider.height + 12 + top_extra + 10
-            vol_overlay_surf = pygame.Surface((vol_overlay_w, vol_overlay_h), pygame.SRCALPHA)
-            vol_overlay_surf.fill((0, 0, 0, int(255 * 0.5)))
-            vol_overlay_x = self.volume_slider.x - 8
-            vol_overlay_y = self.volume_slider.y - top_extra
-            self.screen.blit(vol_overlay_surf, (vol_overlay_x, vol_overlay_y))
-        except Exception:
-            pass
 
         self.volume_slider.draw(
             self.screen,
@@ -3562,7 +3690,6 @@ class UI:
                 self.exit_confirm_yes.draw(self.screen, self.small_font)
                 self.exit_confirm_no.draw(self.screen, self.small_font)
 
-            pygame.display.flip()
             return  # Exit early for empty library
 
         # Content area (between top controls and bottom area)
@@ -3818,9 +3945,6 @@ class UI:
             self.exit_confirm_yes.draw(self.screen, self.small_font)
             self.exit_confirm_no.draw(self.screen, self.small_font)
 
-        # Final flip once per frame
-        pygame.display.flip()
-
     def _update_album_card_auto_scroll(self) -> None:
         """Update auto-scrolling for album cards that have more tracks than can be displayed"""
         if not self.album_card_auto_scroll_enabled:
@@ -4887,6 +5011,10 @@ class UI:
         # Choose appropriate font for buttons based on scale
         button_font = self.medium_font if self.fullscreen else self.small_font
 
+        # Labels of the keypad buttons below, blitted together at the end
+        # (the button rects never overlap, so deferring them is invisible)
+        labels = []
+
         # Update button sizes and positions - draw all buttons properly
         # Draw according to the active keypad layout mode
         if self.use_new_keypad_layout:
@@ -4940,7 +5068,7 @@ class UI:
                 btn.rect.height = pad_button_h
                 btn.rect.x = cols[i]
                 btn.rect.y = pad_y
-                btn.draw(self.screen, self.medium_font if label == "ENT" else button_font)
+                btn.draw(self.screen, self.medium_font if label == "ENT" else button_font, labels)
 
             # Row 1: 6 7 8 9 0 < CLR
             row1 = ["6", "7", "8", "9", "0", "<", "CLR"]
@@ -4952,7 +5080,7 @@ class UI:
                 btn.rect.height = pad_button_h
                 btn.rect.x = cols[i]
                 btn.rect.y = pad_y + (pad_button_h + spacing)
-                btn.draw(self.screen, button_font)
+                btn.draw(self.screen, button_font, labels)
 
         else:
             # First 9 buttons (1-9) in 3x3 grid (legacy calculator layout)
@@ -4965,7 +5093,7 @@ class UI:
                         btn.rect.height = pad_button_h
                         btn.rect.x = pad_x + col * (pad_button_w + spacing)
                         btn.rect.y = pad_y + row * (pad_button_h + spacing)
-                        btn.draw(self.screen, button_font)
+                        btn.draw(self.screen, button_font, labels)
 
         # Draw button 0 (index 9) - left position in row 4
         if not self.use_new_keypad_layout:
@@ -4975,7 +5103,7 @@ class UI:
                 btn_0.rect.height = pad_button_h
                 btn_0.rect.x = pad_x
                 btn_0.rect.y = pad_y + 3 * (pad_button_h + spacing)
-                btn_0.draw(self.screen, button_font)
+                btn_0.draw(self.screen, button_font, labels)
 
         # Draw backspace button (index 10) - middle position in row 4
         if not self.use_new_keypad_layout:
@@ -4985,7 +5113,7 @@ class UI:
                 btn_back.rect.height = pad_button_h
                 btn_back.rect.x = pad_x + (pad_button_w + spacing)
                 btn_back.rect.y = pad_y + 3 * (pad_button_h + spacing)
-                btn_back.draw(self.screen, button_font)
+                btn_back.draw(self.screen, button_font, labels)
 
         # Draw CLR button (index 11) - left side of row 5
         if not self.use_new_keypad_layout:
@@ -4995,7 +5123,7 @@ class UI:
                 btn_clr.rect.height = pad_button_h
                 btn_clr.rect.x = pad_x
                 btn_clr.rect.y = pad_y + 4 * (pad_button_h + spacing)
-                btn_clr.draw(self.screen, button_font)
+                btn_clr.draw(self.screen, button_font, labels)
 
         # Draw ENT button (index 12) - right side of row 5
         if not self.use_new_keypad_layout:
@@ -5012,6 +5140,9 @@ class UI:
             btn_ent.rect.y = pad_y + 4 * (pad_button_h + spacing)
             btn_ent.draw(self.screen, self.medium_font)
 
+        if labels:
+            self.screen.blits(labels, doreturn=False)
+
         # Selection display is shown above the Now Playing card (moved there)
 
     def draw_audio_controls(self) -> None:
@@ -5168,14 +5299,18 @@ class UI:
         overlay_y = text_y_position - 5  # Slightly above the text
         self.screen.blit(overlay_surface, (0, overlay_y))
 
-    def draw_top_text_overlay(self, text_y_position, text_height=50):
-        """Draw a semi-transparent black overlay across the top for better text contrast"""
+    def draw_top_text_overlay(self, text_y_position, text_height=50, surface=None):
+        """Draw a semi-transparent black overlay across the top for better text contrast
+
+        Draws onto `surface` when given, otherwise onto the screen.
+        """
         overlay_surface = pygame.Surface((self.width, text_height))
         overlay_surface.set_alpha(int(255 * 0.85))  # 85% opacity
         overlay_surface.fill(Colors.BLACK)
         # Position overlay to cover the text area from the top
         overlay_y = 0  # Start from the very top of the screen
-        self.screen.blit(overlay_surface, (0, overlay_y))
+        target = self.screen if surface is None else surface
+        target.blit(overlay_surface, (0, overlay_y))
 
     def get_album_art(self, album):
         """Return cached album art surface or attempt to load one"""
@@ -5680,8 +5815,6 @@ class UI:
         )
         self.screen.blit(instructions, instructions_rect)
 
-        pygame.display.flip()
-
     def run(self) -> None:
         """Main UI loop"""
         frame_count = 0
@@ -5696,7 +5829,8 @@ class UI:
             self.player.update_music_state()
             self.draw()
 
-            # Use standard display flip for consistent rendering
+            # The draw_* methods only render; present the finished frame
+            # (including any debug overlay) exactly once here.
             pygame.display.flip()
 
             self.clock.tick(self.fps)
@@ -5715,8 +5849,7 @@ class UI:
             # Switch to fullscreen
             self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
             # Get actual fullscreen dimensions
-            self.width = self.screen.get_width()
-            self.height = self.screen.get_height()
+            self.width, self.height = self.screen.get_size()
         else:
             # Switch to windowed mode
             windowed_width = self.config.get("window_width", 1200)
@@ -131,9 +131,10 @@ class Slider:
 
         # Use theme colors if available
         if self.theme:
-            track_color = self.theme.get_color("slider_track", track_color)
-            knob_color = self.theme.get_color("slider_knob", knob_color)
-            fill_color = self.theme.get_color("accent", fill_color)
+            # The theme's cached pygame.Color objects
+            track_color = self.theme.get_pg_color("slider_track", track_color)
+            knob_color = self.theme.get_pg_color("slider_knob", knob_color)
+            fill_color = self.theme.get_pg_color("accent", fill_color)
 
         # Draw fill (value portion)
         fill_width = self.knob_rect.centerx - self.track_rect.x
@@ -277,9 +278,10 @@ class VerticalSlider(Slider):
 
         # Use theme colors if available
         if self.theme:
-            track_color = self.theme.get_color("slider_track", track_color)
-            knob_color = self.theme.get_color("slider_knob", knob_color)
-            fill_color = self.theme.get_color("accent", fill_color)
+            # The theme's cached pygame.Color objects
+            track_color = self.theme.get_pg_color("slider_track", track_color)
+            knob_color = self.theme.get_pg_color("slider_knob", knob_color)
+            fill_color = self.theme.get_pg_color("accent", fill_color)
 
         # Draw fill (value portion)
         fill_height = self.y + self.height - self.knob_rect.centery